@@ -23,24 +23,49 @@ import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import time
 import random
+from itertools import count
 import numpy as np
 import sys
 import os
 from streamlit.components.v1 import html
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
+import string
+from bisect import bisect_right
 import io
 import base64
-from fpdf import FPDF
-import plotly.io as pio
+from types import SimpleNamespace
+import textwrap
+
+# Optional JIT compilation for hot numeric kernels
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Optional Markdown renderer; static documentation blocks are pre-rendered to HTML when it is installed
+try:
+    import markdown
+    MARKDOWN_AVAILABLE = True
+except ImportError:
+    MARKDOWN_AVAILABLE = False
+
+# Optional faster Excel writer; falls back to openpyxl's write-only mode
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
 
 # Add engine directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'engine'))
 from api_integration import bank_connector, quality_monitor
 from advanced_analytics import risk_analytics, portfolio_optimizer
 from performance_monitor import performance_monitor, data_processing_monitor, dashboard_tracker
-from report_generator import pdf_generator
-from ml_predictions import ml_predictor, model_updater
 
 # Add docs directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'docs'))
@@ -139,63 +164,111 @@ SIMULATED_DATA = {
     'transaction_level': 'Real-time simulated transaction data with credit metrics'
 }
 
+# Random generator used for batched simulation draws
+RNG = np.random.default_rng()
+
+# Cap on simultaneous requests to the public data APIs
+MAX_CONCURRENT_FETCHES = 4
+
+@st.cache_resource
+def get_http_session():
+    """Shared HTTP session so connections to the data APIs are pooled across reruns"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10,
+                          max_retries=Retry(total=3, backoff_factor=0.3))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def fetch_json_concurrently(urls, timeout=5, stream_urls=()):
+    """Fetch several JSON endpoints in parallel, returning ({url: json}, [errors])"""
+    session = get_http_session()
+    
+    def fetch(url):
+        # Streamed responses skip the eager body read, and the context manager
+        # hands the connection back to the pool as soon as the JSON is parsed
+        with session.get(url, timeout=timeout, stream=url in stream_urls) as response:
+            if response.status_code == 200:
+                return response.json()
+            return None
+    
+    results = {}
+    errors = []
+    unique_urls = list(dict.fromkeys(urls))  # Each endpoint is hit once even if shared
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_FETCHES, len(unique_urls))) as executor:
+        futures = {executor.submit(fetch, url): url for url in unique_urls}
+        for future in as_completed(futures):
+            try:
+                data = future.result()
+                if data is not None:
+                    results[futures[future]] = data
+            except Exception as e:
+                errors.append(e)
+    
+    return results, errors
+
+# Real market data is refetched at most this often (seconds), per session and across sessions
+REAL_DATA_REFRESH_SECONDS = 300
+
+@st.cache_data(ttl=REAL_DATA_REFRESH_SECONDS, show_spinner=False)
 def fetch_real_public_data():
-    """Fetch real public data from various APIs"""
+    """Fetch real public data from various APIs (cached for 5 minutes across reruns)"""
     real_data = {}
     
+    # All sources are requested concurrently, so a rerun waits for the slowest call only
+    responses, errors = fetch_json_concurrently([
+        REAL_DATA_SOURCES['zar_usd_rate'],
+        REAL_DATA_SOURCES['gas_fees'],
+        REAL_DATA_SOURCES['stablecoin_mcap'],
+    ], stream_urls={REAL_DATA_SOURCES['stablecoin_mcap']})  # Largest payload (market caps)
+    
     try:
         # ZAR/USD Exchange Rate (free API)
-        zar_response = requests.get(REAL_DATA_SOURCES['zar_usd_rate'], timeout=5)
-        if zar_response.status_code == 200:
-            zar_data = zar_response.json()
+        zar_data = responses.get(REAL_DATA_SOURCES['zar_usd_rate'])
+        if zar_data:
             real_data['zar_usd_rate'] = zar_data['rates']['USD']
         
         # Gas Fees (Etherscan - free tier)
-        gas_response = requests.get(REAL_DATA_SOURCES['gas_fees'], timeout=5)
-        if gas_response.status_code == 200:
-            gas_data = gas_response.json()
-            if gas_data['status'] == '1':
-                # Handle both string and numeric gas prices
-                gas_price = gas_data['result']['SafeGasPrice']
-                try:
-                    real_data['gas_fees'] = int(float(gas_price))
-                except (ValueError, TypeError):
-                    # Fallback to realistic gas price if conversion fails
-                    real_data['gas_fees'] = 25
+        gas_data = responses.get(REAL_DATA_SOURCES['gas_fees'])
+        if gas_data and gas_data['status'] == '1':
+            # Handle both string and numeric gas prices
+            gas_price = gas_data['result']['SafeGasPrice']
+            try:
+                real_data['gas_fees'] = int(float(gas_price))
+            except (ValueError, TypeError):
+                # Fallback to realistic gas price if conversion fails
+                real_data['gas_fees'] = 25
         
         # Stablecoin Market Cap (CoinGecko - free)
-        stablecoin_response = requests.get(REAL_DATA_SOURCES['stablecoin_mcap'], timeout=5)
-        if stablecoin_response.status_code == 200:
-            stablecoin_data = stablecoin_response.json()
+        stablecoin_data = responses.get(REAL_DATA_SOURCES['stablecoin_mcap'])
+        if stablecoin_data:
             real_data['usdc_mcap'] = stablecoin_data['usd-coin']['usd_market_cap']
             real_data['usdt_mcap'] = stablecoin_data['tether']['usd_market_cap']
         
         # VIX Index (if API key available)
-        # vix_response = requests.get(REAL_DATA_SOURCES['vix_index'], timeout=5)
-        # if vix_response.status_code == 200:
-        #     vix_data = vix_response.json()
+        # vix_data = responses.get(REAL_DATA_SOURCES['vix_index'])
+        # if vix_data:
         #     real_data['vix_index'] = vix_data[0]['price']
         
     except Exception as e:
+        errors.append(e)
+    
+    for e in errors:
         # Only show warning for non-critical errors (like API timeouts)
         if "timeout" in str(e).lower() or "connection" in str(e).lower():
             st.warning(f"Some real data sources temporarily unavailable: {str(e)}")
+            break
         # For other errors, just log them without showing to user
-        pass
     
     return real_data
 
-def calculate_realistic_brics_price(real_data):
-    """Calculate $BRICS price using real public data + live CDS spreads"""
-    
-    # Base components from real data
-    zar_rate = real_data.get('zar_usd_rate', 18.5)  # Fallback to realistic ZAR rate
-    gas_fees = real_data.get('gas_fees', 25)  # Fallback to realistic gas
-    
-    # Live CDS spreads from real data
-    south_africa_cds = real_data.get('south_africa_cds', 180)  # Live CDS spread
-    emerging_market_cds = real_data.get('emerging_market_cds', 250)  # EM CDS spread
-    zar_volatility_adjustment = real_data.get('zar_volatility_adjustment', 0)  # ZAR volatility effect
+def calculate_realistic_brics_price_vec(zar_rate, gas_fees, south_africa_cds, emerging_market_cds, zar_volatility_adjustment):
+    """Calculate $BRICS prices element-wise over arrays of market inputs (e.g. a backtest history)"""
+    zar_rate = np.asarray(zar_rate, dtype=np.float64)
+    gas_fees = np.asarray(gas_fees, dtype=np.float64)
+    south_africa_cds = np.asarray(south_africa_cds, dtype=np.float64)
+    emerging_market_cds = np.asarray(emerging_market_cds, dtype=np.float64)
+    zar_volatility_adjustment = np.asarray(zar_volatility_adjustment, dtype=np.float64)
     
     # CDS premium calculation using live spreads
     cds_premium = (south_africa_cds + emerging_market_cds + zar_volatility_adjustment) / 10000
@@ -212,296 +285,363 @@ def calculate_realistic_brics_price(real_data):
     # Calculate $BRICS price with live CDS data
     brics_price = 1.00 + cds_premium + zar_effect + volatility + market_stress
     
-    return max(0.98, min(1.05, brics_price))  # Bound between $0.98-$1.05
+    return np.clip(brics_price, 0.98, 1.05)  # Bound between $0.98-$1.05
 
+def calculate_realistic_brics_price(real_data):
+    """Calculate $BRICS price using real public data + live CDS spreads"""
+    brics_price = calculate_realistic_brics_price_vec(
+        real_data.get('zar_usd_rate', 18.5),  # Fallback to realistic ZAR rate
+        real_data.get('gas_fees', 25),  # Fallback to realistic gas
+        real_data.get('south_africa_cds', 180),  # Live CDS spread
+        real_data.get('emerging_market_cds', 250),  # EM CDS spread
+        real_data.get('zar_volatility_adjustment', 0)  # ZAR volatility effect
+    )
+    return float(brics_price)
 
 
-def fetch_live_cds_data():
-    """Fetch live CDS spread data and proxies"""
-    cds_data = {}
+
+# VIX quote used as a proxy for CDS spreads (demo key)
+VIX_QUOTE_URL = 'https://api.financialmodelingprep.com/v3/quote/^VIX?apikey=demo'
+
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_cds_base():
+    """Fetch CDS proxies as (sa_cds, em_cds, zar_vol_adjustment), None where unavailable (cached 60s)"""
+    south_africa_cds = None
+    emerging_market_cds = None
+    zar_volatility_adjustment = None
     
     try:
+        # VIX and ZAR proxies are requested concurrently
+        responses, errors = fetch_json_concurrently([VIX_QUOTE_URL, REAL_DATA_SOURCES['zar_usd_rate']])
+        if errors:
+            raise errors[0]
+        
         # Proxy CDS spreads using VIX and ZAR volatility
-        vix_response = requests.get('https://api.financialmodelingprep.com/v3/quote/^VIX?apikey=demo', timeout=5)
-        if vix_response.status_code == 200:
-            vix_data = vix_response.json()
-            if vix_data and len(vix_data) > 0:
-                vix_level = vix_data[0].get('price', 20)
-                # Convert VIX to CDS proxy (higher VIX = higher CDS spreads)
-                cds_data['south_africa_cds'] = max(150, min(300, 180 + (vix_level - 20) * 3))
-                cds_data['emerging_market_cds'] = max(200, min(400, 250 + (vix_level - 20) * 4))
+        vix_data = responses.get(VIX_QUOTE_URL)
+        if vix_data and len(vix_data) > 0:
+            vix_level = vix_data[0].get('price', 20)
+            # Convert VIX to CDS proxy (higher VIX = higher CDS spreads)
+            south_africa_cds = max(150, min(300, 180 + (vix_level - 20) * 3))
+            emerging_market_cds = max(200, min(400, 250 + (vix_level - 20) * 4))
         
         # ZAR volatility as emerging market risk indicator
-        zar_response = requests.get(REAL_DATA_SOURCES['zar_usd_rate'], timeout=5)
-        if zar_response.status_code == 200:
-            zar_data = zar_response.json()
+        zar_data = responses.get(REAL_DATA_SOURCES['zar_usd_rate'])
+        if zar_data:
             zar_rate = zar_data['rates']['USD']
             # ZAR volatility affects CDS spreads
             zar_volatility = abs(zar_rate - 18.5) / 18.5
-            cds_data['zar_volatility_adjustment'] = zar_volatility * 50  # 50bp adjustment per 1% ZAR move
-        
-        # Add realistic CDS term structure
-        cds_data['cds_1y'] = cds_data.get('south_africa_cds', 180)
-        cds_data['cds_5y'] = cds_data.get('south_africa_cds', 180) + 20
-        cds_data['cds_10y'] = cds_data.get('south_africa_cds', 180) + 35
+            zar_volatility_adjustment = zar_volatility * 50  # 50bp adjustment per 1% ZAR move
         
     except Exception as e:
         # Fallback to realistic CDS spreads
-        cds_data = {
-            'south_africa_cds': 180,
-            'emerging_market_cds': 250,
-            'cds_1y': 180,
-            'cds_5y': 200,
-            'cds_10y': 215,
-            'zar_volatility_adjustment': 0
-        }
+        return 180, 250, 0
+    
+    return south_africa_cds, emerging_market_cds, zar_volatility_adjustment
+
+def fetch_live_cds_data():
+    """Fetch live CDS spread data and proxies"""
+    south_africa_cds, emerging_market_cds, zar_volatility_adjustment = fetch_cds_base()
+    
+    cds_data = {}
+    if south_africa_cds is not None:
+        cds_data['south_africa_cds'] = south_africa_cds
+    if emerging_market_cds is not None:
+        cds_data['emerging_market_cds'] = emerging_market_cds
+    if zar_volatility_adjustment is not None:
+        cds_data['zar_volatility_adjustment'] = zar_volatility_adjustment
+    
+    # Add realistic CDS term structure
+    base_cds = cds_data.get('south_africa_cds', 180)
+    cds_data['cds_1y'] = base_cds
+    cds_data['cds_5y'] = base_cds + 20
+    cds_data['cds_10y'] = base_cds + 35
     
     return cds_data
 
+# Real South African transaction patterns with more variety
+TRANSACTION_TYPES = {
+    'trade_receivables': {'avg_amount': 50000, 'tenor': 60, 'pd_base': 0.05, 'frequency': 0.4},
+    'supply_chain': {'avg_amount': 75000, 'tenor': 90, 'pd_base': 0.06, 'frequency': 0.25},
+    'working_capital': {'avg_amount': 120000, 'tenor': 120, 'pd_base': 0.07, 'frequency': 0.2},
+    'equipment_finance': {'avg_amount': 200000, 'tenor': 180, 'pd_base': 0.08, 'frequency': 0.1},
+    'invoice_discounting': {'avg_amount': 35000, 'tenor': 45, 'pd_base': 0.04, 'frequency': 0.05}
+}
+
+# More diverse industries
+INDUSTRIES = [
+    'mining', 'manufacturing', 'financial', 'retail', 'agriculture',
+    'energy', 'technology', 'telecommunications', 'beverages', 'automotive',
+    'construction', 'healthcare', 'education', 'logistics', 'real_estate'
+]
+
+# More diverse credit ratings
+CREDIT_RATINGS = ['AAA', 'AA+', 'AA', 'AA-', 'A+', 'A', 'A-', 'BBB+', 'BBB', 'BBB-', 'BB+', 'BB', 'BB-']
+
+# More diverse collateral types
+COLLATERAL_TYPES = ['receivables', 'inventory', 'equipment', 'real_estate', 'intellectual_property', 'cash_flows']
+
+# Portfolio composition choices for generated obligors
+CREDIT_TYPES = ['Trade Receivables', 'Supply Chain Finance', 'Working Capital', 'Equipment Finance', 'Invoice Discounting']
+UNDERWRITING_BANKS = ['First National Bank', 'Standard Bank', 'Nedbank', 'ABSA Bank', 'Old Mutual', 'Investec', 'Capitec', 'African Bank']
+COMPANY_STATUSES = ['On track', 'Watch', 'Under review', 'Stable']
+TIME_LISTED_CHOICES = ['1mo ago', '2mo ago', '3mo ago', '6mo ago', '1yr ago']
+
+# Spread based on rating (bps)
+SPREAD_BASE_BPS = {'AAA': 15, 'AA+': 18, 'AA': 20, 'AA-': 22, 'A+': 25, 'A': 28, 'A-': 30,
+                   'BBB+': 35, 'BBB': 38, 'BBB-': 42, 'BB+': 50, 'BB': 60, 'BB-': 75}
+
+# Candidate ratings per PD band (<3%, <5%, <8%, <12%, higher) for generated obligors
+PD_BAND_BINS = np.array([0.03, 0.05, 0.08, 0.12])
+PD_BAND_RATING_CANDIDATES = np.array([
+    ['AAA', 'AA+', 'AA'],
+    ['AA-', 'A+', 'A'],
+    ['A-', 'BBB+', 'BBB'],
+    ['BBB-', 'BB+', 'BB'],
+    ['BB-', 'B+', 'B']
+], dtype=object)
+
+# Base spread (bps) aligned with PD_BAND_RATING_CANDIDATES; unlisted ratings default to 40
+PD_BAND_SPREAD_BPS = np.array([[SPREAD_BASE_BPS.get(rating, 40) for rating in band] for band in PD_BAND_RATING_CANDIDATES])
+
+# Categorical dtypes for the low-cardinality company label columns; ratings are ordered best to worst
+COMPANY_CATEGORY_DTYPES = {
+    'industry': pd.CategoricalDtype(INDUSTRIES),
+    'credit_rating': pd.CategoricalDtype(CREDIT_RATINGS + ['B+', 'B'], ordered=True),
+    'status': pd.CategoricalDtype(COMPANY_STATUSES),
+    'credit_type': pd.CategoricalDtype(CREDIT_TYPES),
+    'underwriting_bank': pd.CategoricalDtype(UNDERWRITING_BANKS),
+    'time_listed': pd.CategoricalDtype(TIME_LISTED_CHOICES)
+}
+
+# Object arrays for gathering labels by drawn index
+INDUSTRY_ARRAY = np.array(INDUSTRIES, dtype=object)
+CREDIT_RATING_ARRAY = np.array(CREDIT_RATINGS, dtype=object)
+COLLATERAL_TYPE_ARRAY = np.array(COLLATERAL_TYPES, dtype=object)
+
+# Transaction type parameters as arrays aligned with TX_TYPE_NAMES
+TX_TYPE_NAMES = list(TRANSACTION_TYPES.keys())
+TX_TYPE_NAME_ARRAY = np.array(TX_TYPE_NAMES, dtype=object)
+TX_TYPE_PROBS = np.array([tx['frequency'] for tx in TRANSACTION_TYPES.values()])
+TX_TYPE_PROBS = TX_TYPE_PROBS / TX_TYPE_PROBS.sum()
+TX_AVG_AMOUNTS = np.array([tx['avg_amount'] for tx in TRANSACTION_TYPES.values()], dtype=np.float64)
+TX_TENORS = np.array([tx['tenor'] for tx in TRANSACTION_TYPES.values()])
+TX_BASE_PDS = np.array([tx['pd_base'] for tx in TRANSACTION_TYPES.values()])
+
+# Weighted company selection for private placement
+# Larger companies (COMP_1-30) get 3x, COMP_31-60 2x, smaller companies standard weight
+COMPANY_NUMBERS = np.arange(1, 101)
+COMPANY_SELECTION_PROBS = np.repeat([3.0, 2.0, 1.0], [30, 30, 40])
+COMPANY_SELECTION_PROBS = COMPANY_SELECTION_PROBS / COMPANY_SELECTION_PROBS.sum()
+
+@st.cache_resource
+def get_transaction_id_counter():
+    """Process-wide monotonic transaction ID sequence, seeded from the start-up time in ms"""
+    return count(int(time.time() * 1000))
+
 def simulate_live_transaction_data():
     """Simulate real-time transaction-level credit data with realistic volumes"""
     
-    # Real South African transaction patterns with more variety
-    transaction_types = {
-        'trade_receivables': {'avg_amount': 50000, 'tenor': 60, 'pd_base': 0.05, 'frequency': 0.4},
-        'supply_chain': {'avg_amount': 75000, 'tenor': 90, 'pd_base': 0.06, 'frequency': 0.25},
-        'working_capital': {'avg_amount': 120000, 'tenor': 120, 'pd_base': 0.07, 'frequency': 0.2},
-        'equipment_finance': {'avg_amount': 200000, 'tenor': 180, 'pd_base': 0.08, 'frequency': 0.1},
-        'invoice_discounting': {'avg_amount': 35000, 'tenor': 45, 'pd_base': 0.04, 'frequency': 0.05}
-    }
-    
-    # Generate realistic transaction stream (much lower volume)
-    transactions = []
-    
     # Private placement transaction volume: All selected obligors should be active
     # In a curated portfolio, we select obligors for their activity and credit quality
-    num_transactions = random.choices([2, 3, 4, 5], weights=[0.2, 0.3, 0.3, 0.2])[0]  # 2-5 transactions per update
-    
-    # Create weighted company selection for private placement
-    # Larger companies (COMP_1-30) get higher weights for selection
-    company_weights = []
-    for i in range(1, 101):
-        if i <= 30:
-            company_weights.append(3.0)  # 3x more likely to be selected
-        elif i <= 60:
-            company_weights.append(2.0)  # 2x more likely
-        else:
-            company_weights.append(1.0)  # Standard weight for smaller companies
-    
-    for _ in range(num_transactions):
-        # Weighted transaction type selection based on frequency
-        tx_type = random.choices(
-            list(transaction_types.keys()),
-            weights=[tx['frequency'] for tx in transaction_types.values()]
-        )[0]
-        tx_data = transaction_types[tx_type]
-        
-        # Real-time credit factors with more variation
-        base_pd = tx_data['pd_base']
-        industry_multiplier = random.uniform(0.7, 1.5)  # More variation
-        credit_rating_multiplier = random.uniform(0.5, 1.3)  # More variation
-        market_stress_multiplier = 1.0 + (random.random() * 0.4)  # More stress variation
-        
-        # Calculate real-time PD
-        live_pd = base_pd * industry_multiplier * credit_rating_multiplier * market_stress_multiplier
-        
-        # Curated portfolio selection: Focus on active, creditworthy obligors
-        # In private placement, we select obligors based on activity and credit quality
-        # Weight selection toward larger, more active companies
-        company_id = f"COMP_{random.choices(range(1, 101), weights=company_weights)[0]}"
-        
-        # More diverse industries
-        industries = [
-            'mining', 'manufacturing', 'financial', 'retail', 'agriculture',
-            'energy', 'technology', 'telecommunications', 'beverages', 'automotive',
-            'construction', 'healthcare', 'education', 'logistics', 'real_estate'
-        ]
-        
-        # More diverse credit ratings
-        credit_ratings = ['AAA', 'AA+', 'AA', 'AA-', 'A+', 'A', 'A-', 'BBB+', 'BBB', 'BBB-', 'BB+', 'BB', 'BB-']
-        
-        # More diverse collateral types
-        collateral_types = ['receivables', 'inventory', 'equipment', 'real_estate', 'intellectual_property', 'cash_flows']
-        
-        transaction = {
-            'transaction_id': f"TX_{datetime.now().strftime('%Y%m%d%H%M%S')}_{random.randint(1000, 9999)}",
-            'timestamp': datetime.now(),
-            'type': tx_type,
-            'amount': random.uniform(tx_data['avg_amount'] * 0.4, tx_data['avg_amount'] * 1.6),
-            'tenor_days': tx_data['tenor'],
-            'pd': live_pd,
-            'credit_rating': random.choice(credit_ratings),
-            'industry': random.choice(industries),
-            'company_id': company_id,
-            'collateral_type': random.choice(collateral_types),
-            'recovery_rate': random.uniform(0.35, 0.65)
-        }
-        transactions.append(transaction)
+    num_transactions = RNG.choice([2, 3, 4, 5], p=[0.2, 0.3, 0.3, 0.2])  # 2-5 transactions per update
+    
+    # Weighted transaction type selection based on frequency, drawn for the whole batch
+    tx_type_idx = RNG.choice(len(TX_TYPE_NAMES), size=num_transactions, p=TX_TYPE_PROBS)
+    avg_amount = TX_AVG_AMOUNTS[tx_type_idx]
+    tenor = TX_TENORS[tx_type_idx]
+    base_pd = TX_BASE_PDS[tx_type_idx]
+    
+    # Real-time credit factors with more variation
+    industry_multiplier = RNG.uniform(0.7, 1.5, size=num_transactions)  # More variation
+    credit_rating_multiplier = RNG.uniform(0.5, 1.3, size=num_transactions)  # More variation
+    market_stress_multiplier = 1.0 + (RNG.random(num_transactions) * 0.4)  # More stress variation
+    
+    # Calculate real-time PD
+    live_pd = base_pd * industry_multiplier * credit_rating_multiplier * market_stress_multiplier
+    
+    # Curated portfolio selection: Weight selection toward larger, more active companies
+    company_numbers = RNG.choice(COMPANY_NUMBERS, size=num_transactions, p=COMPANY_SELECTION_PROBS)
+    
+    amounts = RNG.uniform(avg_amount * 0.4, avg_amount * 1.6)
+    rating_idx = RNG.integers(0, len(CREDIT_RATINGS), size=num_transactions)
+    industry_idx = RNG.integers(0, len(INDUSTRIES), size=num_transactions)
+    collateral_idx = RNG.integers(0, len(COLLATERAL_TYPES), size=num_transactions)
+    recovery_rates = RNG.uniform(0.35, 0.65, size=num_transactions)
+    
+    # Assemble the batch column-wise, one array per field
+    tx_counter = get_transaction_id_counter()
+    transactions = pd.DataFrame({
+        'transaction_id': [f"TX_{next(tx_counter):016d}" for _ in range(num_transactions)],
+        'timestamp': datetime.now(),
+        'type': TX_TYPE_NAME_ARRAY[tx_type_idx],
+        'amount': amounts,
+        'tenor_days': tenor,
+        'pd': live_pd,
+        'credit_rating': CREDIT_RATING_ARRAY[rating_idx],
+        'industry': INDUSTRY_ARRAY[industry_idx],
+        'company_id': [f"COMP_{number}" for number in company_numbers.tolist()],
+        'collateral_type': COLLATERAL_TYPE_ARRAY[collateral_idx],
+        'recovery_rate': recovery_rates
+    })
     
     return transactions
 
-def calculate_company_specific_risk(company_id, company_data, transactions):
-    """Calculate comprehensive company-specific risk factors"""
-    
-    # Get company profile
-    company_exists = company_id in company_data['company'].values
-    if company_exists:
-        company_profile = company_data[company_data['company'] == company_id].iloc[0]
-    else:
-        company_profile = None
-    
-    if company_profile is None:
-        return {
-            'industry_risk': 1.0,
-            'size_risk': 1.0,
-            'geographic_risk': 1.0,
-            'business_model_risk': 1.0,
-            'financial_health_risk': 1.0,
-            'management_risk': 1.0,
-            'concentration_risk': 1.0
-        }
-    
-    # 1. Industry Risk Factors (South African context)
-    industry_risk_factors = {
-        'mining': 1.2,      # High volatility, commodity prices
-        'manufacturing': 1.1, # Moderate risk, supply chain issues
-        'financial': 0.9,    # Lower risk, regulated
-        'retail': 1.0,       # Standard risk
-        'agriculture': 1.3,  # High weather/climate risk
-        'energy': 1.4,       # High regulatory/political risk
-        'technology': 1.1,   # Moderate risk, innovation
-        'telecommunications': 0.8, # Lower risk, stable
-        'beverages': 0.9,    # Lower risk, defensive
-        'automotive': 1.2,   # Moderate risk, cyclical
-        'construction': 1.3, # High risk, project-based
-        'healthcare': 0.8,   # Lower risk, defensive
-        'education': 0.9,    # Lower risk, stable
-        'logistics': 1.1,    # Moderate risk, fuel prices
-        'real_estate': 1.5   # Highest risk, market cycles
-    }
-    industry = company_profile.get('industry', 'retail')
-    industry_risk = industry_risk_factors.get(industry, 1.0)
-    
-    # 2. Company Size Risk (larger = lower risk)
-    total_exposure = company_profile.get('total_exposure', 1000000)
-    if total_exposure > 5000000:
-        size_risk = 0.8  # Large company, lower risk
-    elif total_exposure > 2000000:
-        size_risk = 0.9  # Medium company
-    elif total_exposure > 500000:
-        size_risk = 1.0  # Small company
-    else:
-        size_risk = 1.2  # Very small company, higher risk
-    
-    # 3. Geographic Risk (South African regions)
-    geographic_risk_factors = {
-        'gauteng': 1.0,      # Economic hub, lower risk
-        'western_cape': 0.9,  # Stable, lower risk
-        'kwazulu_natal': 1.1, # Moderate risk
-        'eastern_cape': 1.2,  # Higher risk
-        'limpopo': 1.3,       # Higher risk
-        'mpumalanga': 1.1,    # Moderate risk
-        'north_west': 1.2,    # Higher risk
-        'free_state': 1.1,    # Moderate risk
-        'northern_cape': 1.2  # Higher risk
-    }
-    # Simulate geographic distribution based on company ID
-    regions = list(geographic_risk_factors.keys())
-    company_region = regions[hash(company_id) % len(regions)]
-    geographic_risk = geographic_risk_factors[company_region]
-    
-    # 4. Business Model Risk
-    credit_type = company_profile.get('credit_type', 'Trade Receivables')
-    business_model_risk_factors = {
-        'Trade Receivables': 1.0,    # Standard
-        'Supply Chain Finance': 1.1,  # Higher risk
-        'Working Capital': 1.2,       # Higher risk
-        'Equipment Finance': 1.3,     # Higher risk
-        'Real Estate': 1.4,           # Highest risk
-        'Invoice Discounting': 0.9    # Lower risk
-    }
-    business_model_risk = business_model_risk_factors.get(credit_type, 1.0)
-    
-    # 5. Financial Health Risk (based on credit rating)
-    credit_rating = company_profile.get('credit_rating', 'BBB')
-    financial_health_factors = {
-        'AAA': 0.7, 'AA+': 0.75, 'AA': 0.8, 'AA-': 0.85,
-        'A+': 0.9, 'A': 0.95, 'A-': 1.0,
-        'BBB+': 1.05, 'BBB': 1.1, 'BBB-': 1.15,
-        'BB+': 1.3, 'BB': 1.4, 'BB-': 1.5,
-        'B+': 1.7, 'B': 1.9, 'B-': 2.1
-    }
-    financial_health_risk = financial_health_factors.get(credit_rating, 1.1)
-    
-    # 6. Management Risk (simulated based on company performance)
-    # Companies with better performance have lower management risk
-    avg_pd = company_profile.get('avg_pd', 0.06)
-    if avg_pd < 0.04:
-        management_risk = 0.8  # Excellent management
-    elif avg_pd < 0.06:
-        management_risk = 0.9  # Good management
-    elif avg_pd < 0.08:
-        management_risk = 1.0  # Average management
-    elif avg_pd < 0.10:
-        management_risk = 1.1  # Poor management
-    else:
-        management_risk = 1.3  # Very poor management
-    
-    # 7. Concentration Risk (exposure relative to portfolio)
-    portfolio_total = company_data['total_exposure'].sum()
-    concentration_ratio = total_exposure / portfolio_total if portfolio_total > 0 else 0
-    
-    if concentration_ratio > 0.15:
-        concentration_risk = 1.4  # High concentration
-    elif concentration_ratio > 0.10:
-        concentration_risk = 1.2  # Moderate concentration
-    elif concentration_ratio > 0.05:
-        concentration_risk = 1.1  # Low concentration
-    else:
-        concentration_risk = 1.0  # Well diversified
-    
-    return {
-        'industry_risk': industry_risk,
-        'size_risk': size_risk,
-        'geographic_risk': geographic_risk,
-        'business_model_risk': business_model_risk,
-        'financial_health_risk': financial_health_risk,
-        'management_risk': management_risk,
-        'concentration_risk': concentration_risk
-    }
+# ============================================================================
+# COMPANY RISK FACTORS
+# ============================================================================
 
-def calculate_company_pd_from_transactions(company_id, transactions, company_df):
-    """Calculate real-time company PD from transaction data with company-specific risk factors"""
-    
-    # Filter transactions for this company
-    company_transactions = [tx for tx in transactions if tx['company_id'] == company_id]
-    
-    if not company_transactions:
-        return 0.06  # Default PD if no transactions
-    
-    # Calculate base weighted average PD from transactions
-    total_exposure = sum(tx['amount'] for tx in company_transactions)
-    base_weighted_pd = sum(tx['pd'] * tx['amount'] for tx in company_transactions) / total_exposure
-    
-    # Get company-specific risk factors
-    company_risk_factors = calculate_company_specific_risk(company_id, company_df, transactions)
-    
-    # Calculate comprehensive risk multiplier
-    total_risk_multiplier = (
-        company_risk_factors['industry_risk'] *
-        company_risk_factors['size_risk'] *
-        company_risk_factors['geographic_risk'] *
-        company_risk_factors['business_model_risk'] *
-        company_risk_factors['financial_health_risk'] *
-        company_risk_factors['management_risk'] *
-        company_risk_factors['concentration_risk']
-    )
-    
-    # Apply company-specific risk adjustment
-    company_specific_pd = base_weighted_pd * total_risk_multiplier
+# 1. Industry Risk Factors (South African context)
+INDUSTRY_RISK_FACTORS = {
+    'mining': 1.2,      # High volatility, commodity prices
+    'manufacturing': 1.1, # Moderate risk, supply chain issues
+    'financial': 0.9,    # Lower risk, regulated
+    'retail': 1.0,       # Standard risk
+    'agriculture': 1.3,  # High weather/climate risk
+    'energy': 1.4,       # High regulatory/political risk
+    'technology': 1.1,   # Moderate risk, innovation
+    'telecommunications': 0.8, # Lower risk, stable
+    'beverages': 0.9,    # Lower risk, defensive
+    'automotive': 1.2,   # Moderate risk, cyclical
+    'construction': 1.3, # High risk, project-based
+    'healthcare': 0.8,   # Lower risk, defensive
+    'education': 0.9,    # Lower risk, stable
+    'logistics': 1.1,    # Moderate risk, fuel prices
+    'real_estate': 1.5   # Highest risk, market cycles
+}
+
+# 3. Geographic Risk (South African regions)
+GEOGRAPHIC_RISK_FACTORS = {
+    'gauteng': 1.0,      # Economic hub, lower risk
+    'western_cape': 0.9,  # Stable, lower risk
+    'kwazulu_natal': 1.1, # Moderate risk
+    'eastern_cape': 1.2,  # Higher risk
+    'limpopo': 1.3,       # Higher risk
+    'mpumalanga': 1.1,    # Moderate risk
+    'north_west': 1.2,    # Higher risk
+    'free_state': 1.1,    # Moderate risk
+    'northern_cape': 1.2  # Higher risk
+}
+
+# 4. Business Model Risk
+BUSINESS_MODEL_RISK_FACTORS = {
+    'Trade Receivables': 1.0,    # Standard
+    'Supply Chain Finance': 1.1,  # Higher risk
+    'Working Capital': 1.2,       # Higher risk
+    'Equipment Finance': 1.3,     # Higher risk
+    'Real Estate': 1.4,           # Highest risk
+    'Invoice Discounting': 0.9    # Lower risk
+}
+
+# 5. Financial Health Risk (based on credit rating)
+FINANCIAL_HEALTH_FACTORS = {
+    'AAA': 0.7, 'AA+': 0.75, 'AA': 0.8, 'AA-': 0.85,
+    'A+': 0.9, 'A': 0.95, 'A-': 1.0,
+    'BBB+': 1.05, 'BBB': 1.1, 'BBB-': 1.15,
+    'BB+': 1.3, 'BB': 1.4, 'BB-': 1.5,
+    'B+': 1.7, 'B': 1.9, 'B-': 2.1
+}
+
+# Integer-coded lookup tables for the factor dicts above; the last slot holds the
+# default used for unknown values (category code -1)
+INDUSTRY_NAMES = list(INDUSTRY_RISK_FACTORS.keys())
+INDUSTRY_RISK_LUT = np.array(list(INDUSTRY_RISK_FACTORS.values()) + [1.0])
+REGION_RISK_LUT = np.array(list(GEOGRAPHIC_RISK_FACTORS.values()))
+CREDIT_TYPE_NAMES = list(BUSINESS_MODEL_RISK_FACTORS.keys())
+BUSINESS_MODEL_RISK_LUT = np.array(list(BUSINESS_MODEL_RISK_FACTORS.values()) + [1.0])
+RATING_NAMES = list(FINANCIAL_HEALTH_FACTORS.keys())
+FINANCIAL_HEALTH_LUT = np.array(list(FINANCIAL_HEALTH_FACTORS.values()) + [1.1])
+
+# Threshold ladders as sorted bins and the level for each bucket
+# "> threshold" ladders are searched with side='left', "< threshold" ladders with side='right'
+SIZE_RISK_BINS = np.array([500000, 2000000, 5000000])  # 2. Company Size Risk (larger = lower risk)
+SIZE_RISK_LEVELS = np.array([1.2, 1.0, 0.9, 0.8])
+MANAGEMENT_RISK_BINS = np.array([0.04, 0.06, 0.08, 0.10])  # 6. Management Risk (lower PD = better management)
+MANAGEMENT_RISK_LEVELS = np.array([0.8, 0.9, 1.0, 1.1, 1.3])
+CONCENTRATION_RISK_BINS = np.array([0.05, 0.10, 0.15])  # 7. Concentration Risk (share of portfolio exposure)
+CONCENTRATION_RISK_LEVELS = np.array([1.0, 1.1, 1.2, 1.4])
+PD_RATING_BINS = np.array([0.03, 0.05, 0.08, 0.12])  # Credit rating implied by live PD
+PD_RATINGS = np.array(['A-', 'BBB+', 'BBB', 'BBB-', 'BB+'], dtype=object)
+
+# Company profile columns the static (lookup-table) risk factors depend on; none change after load
+STATIC_RISK_COLUMNS = ['company', 'industry', 'credit_type']
+
+def build_static_risk_factors(company_df):
+    """Calculate the risk factors that only depend on company profile columns"""
+    # Encode the string columns once and gather from the lookup tables
+    industry_codes = pd.Categorical(company_df['industry'], categories=INDUSTRY_NAMES).codes
+    credit_type_codes = pd.Categorical(company_df['credit_type'], categories=CREDIT_TYPE_NAMES).codes
+    
+    # Simulate geographic distribution based on a stable hash of the company ID
+    region_codes = (pd.util.hash_array(company_df['company'].to_numpy(dtype=object)) % len(REGION_RISK_LUT)).astype(np.int8)
+    
+    return pd.DataFrame({
+        'industry_risk': INDUSTRY_RISK_LUT[industry_codes],
+        'geographic_risk': REGION_RISK_LUT[region_codes],
+        'business_model_risk': BUSINESS_MODEL_RISK_LUT[credit_type_codes]
+    }, index=company_df['company'])
+
+def build_risk_factor_frame(company_df):
+    """Calculate all seven company-specific risk factors for the whole portfolio at once"""
+    
+    # Profile-driven factors are reused from session state until the portfolio's profile columns change
+    static_key = hash(pd.util.hash_pandas_object(company_df[STATIC_RISK_COLUMNS], index=False).to_numpy().tobytes())
+    if st.session_state.get('static_risk_key') != static_key:
+        st.session_state.static_risk_factors = build_static_risk_factors(company_df)
+        st.session_state.static_risk_key = static_key
+    static_risk_factors = st.session_state.static_risk_factors
+    
+    # Rating-, exposure- and PD-driven factors move with every update, so they are always recomputed
+    rating_codes = pd.Categorical(company_df['credit_rating'], categories=RATING_NAMES).codes
+    total_exposure = company_df['total_exposure'].to_numpy(dtype=np.float64)
+    portfolio_total = total_exposure.sum()
+    concentration_ratio = total_exposure / portfolio_total if portfolio_total > 0 else np.zeros_like(total_exposure)
+    
+    risk_factors_df = pd.DataFrame({
+        'industry_risk': static_risk_factors['industry_risk'],
+        'size_risk': SIZE_RISK_LEVELS[np.searchsorted(SIZE_RISK_BINS, total_exposure, side='left')],
+        'geographic_risk': static_risk_factors['geographic_risk'],
+        'business_model_risk': static_risk_factors['business_model_risk'],
+        'financial_health_risk': FINANCIAL_HEALTH_LUT[rating_codes],
+        'management_risk': MANAGEMENT_RISK_LEVELS[np.searchsorted(MANAGEMENT_RISK_BINS, company_df['avg_pd'].to_numpy(), side='right')],
+        'concentration_risk': CONCENTRATION_RISK_LEVELS[np.searchsorted(CONCENTRATION_RISK_BINS, concentration_ratio, side='left')]
+    }, index=static_risk_factors.index)
+    
+    return risk_factors_df
+
+# Display labels for the risk factor columns, in multiplication order
+RISK_FACTOR_LABELS = {
+    'industry_risk': 'Industry Risk',
+    'size_risk': 'Size Risk',
+    'geographic_risk': 'Geographic Risk',
+    'business_model_risk': 'Business Model Risk',
+    'financial_health_risk': 'Financial Health Risk',
+    'management_risk': 'Management Risk',
+    'concentration_risk': 'Concentration Risk'
+}
+
+# Multipliers stay numeric in the risk table; the "1.23x" formatting is applied by the frontend
+RISK_TABLE_COLUMN_CONFIG = {
+    label: st.column_config.NumberColumn(label, format="%.2fx")
+    for label in [*RISK_FACTOR_LABELS.values(), 'Total Risk Multiplier']
+}
+
+# Display formats for the numeric columns of the live transaction summary
+TX_SUMMARY_FORMATS = {'Amount': '${:,.0f}', 'PD': '{:.1%}'}
+
+def build_company_risk_table(company_ids, risk_factors_df):
+    """Risk factors and total multiplier for the given portfolio companies, in the given order"""
+    # One hashed membership pass against the portfolio index, keeping the caller's order
+    company_ids = pd.Index(company_ids)
+    factors = risk_factors_df.loc[company_ids[company_ids.isin(risk_factors_df.index)], list(RISK_FACTOR_LABELS)]
     
-    # Add market stress adjustment (now more sophisticated)
-    # Get current market stress from CDS data if available
+    risk_table = {'Company': factors.index.to_numpy()}
+    for column, label in RISK_FACTOR_LABELS.items():
+        risk_table[label] = factors[column].to_numpy()
+    risk_table['Total Risk Multiplier'] = factors.prod(axis=1).to_numpy()
+    return pd.DataFrame(risk_table)
+
+def get_market_stress_multiplier():
+    """Market stress adjustment derived from the current South Africa CDS spread"""
     market_stress_multiplier = 1.0
     if hasattr(st.session_state, 'cds_data') and st.session_state.cds_data:
         cds_data = st.session_state.cds_data
@@ -509,66 +649,66 @@ def calculate_company_pd_from_transactions(company_id, transactions, company_df)
         # Market stress based on CDS deviation from baseline
         cds_stress = (south_africa_cds - 180) / 180  # -1 to +1 range
         market_stress_multiplier = 1.0 + (cds_stress * 0.2)  # ±20% market stress effect
-    
-    # Final PD calculation with all risk factors
-    final_pd = company_specific_pd * market_stress_multiplier
-    
-    return min(0.25, max(0.01, final_pd))  # Bound between 1%-25%
+    return market_stress_multiplier
+
+# Compact dtypes for the company numeric columns: float32 for risk/yield, int32 for spreads,
+# float64 kept for monetary columns that accumulate fractional transaction amounts
+COMPANY_COLUMN_DTYPES = {
+    'avg_pd': np.float32,
+    'yield': np.float32,
+    'spread_bps': np.int32,
+    'terms_tenor': np.float32,
+    'total_exposure': np.float64,
+    'notional_24h_change': np.float64,
+    'cds_fee_24h_change': np.float32
+}
 
 def update_company_metrics_from_transactions(company_df, transactions):
     """Update company metrics in real-time from transaction data"""
     
-    # Group transactions by company
-    company_transactions = {}
-    for tx in transactions:
-        if tx['company_id'] not in company_transactions:
-            company_transactions[tx['company_id']] = []
-        company_transactions[tx['company_id']].append(tx)
-    
-    # Update each company's metrics
-    for company_id, tx_list in company_transactions.items():
-        if company_id in company_df['company'].values:
-            # Find company index
-            company_idx = company_df[company_df['company'] == company_id].index[0]
-            
-            # Calculate real-time metrics
-            total_exposure = sum(tx['amount'] for tx in tx_list)
-            avg_pd = calculate_company_pd_from_transactions(company_id, tx_list, company_df)
-            avg_tenor = sum(tx['tenor_days'] for tx in tx_list) / len(tx_list)
-            
-            # Update company data
-            company_df.loc[company_idx, 'total_exposure'] = total_exposure
-            company_df.loc[company_idx, 'avg_pd'] = avg_pd
-            company_df.loc[company_idx, 'terms_tenor'] = avg_tenor
-            
-            # Update yield based on PD (higher PD = higher yield)
-            new_yield = 30.0 + (avg_pd * 100)  # Base 30% + PD adjustment
-            company_df.loc[company_idx, 'yield'] = new_yield
-            
-            # Update spread based on PD
-            new_spread = int(30 + (avg_pd * 200))  # Base 30bps + PD adjustment
-            company_df.loc[company_idx, 'spread_bps'] = new_spread
-            
-            # Update credit rating based on PD
-            if avg_pd < 0.03:
-                new_rating = 'A-'
-            elif avg_pd < 0.05:
-                new_rating = 'BBB+'
-            elif avg_pd < 0.08:
-                new_rating = 'BBB'
-            elif avg_pd < 0.12:
-                new_rating = 'BBB-'
-            else:
-                new_rating = 'BB+'
-            
-            company_df.loc[company_idx, 'credit_rating'] = new_rating
-            
-            # Update 24h change metrics - this is the key fix!
-            notional_change = sum(tx['amount'] for tx in tx_list)
-            cds_fee_change = sum(tx['amount'] * tx['pd'] for tx in tx_list)
-            
-            company_df.loc[company_idx, 'notional_24h_change'] = notional_change
-            company_df.loc[company_idx, 'cds_fee_24h_change'] = cds_fee_change
+    # Group transactions by company, keeping only companies in the portfolio
+    tx_df = pd.DataFrame(transactions)
+    if tx_df.empty:
+        return company_df
+    tx_df = tx_df[tx_df['company_id'].isin(company_df['company'])]
+    if tx_df.empty:
+        return company_df
+    
+    # Risk factors are computed once for the portfolio, not once per company
+    risk_multiplier = build_risk_factor_frame(company_df).prod(axis=1)
+    market_stress_multiplier = get_market_stress_multiplier()
+    
+    # Calculate real-time metrics for every active company in one pass
+    tx_df = tx_df.assign(expected_fee=tx_df['amount'] * tx_df['pd'])
+    updates = tx_df.groupby('company_id', sort=False).agg(
+        total_exposure=('amount', 'sum'),
+        terms_tenor=('tenor_days', 'mean'),
+        cds_fee_24h_change=('expected_fee', 'sum')
+    )
+    
+    # Exposure-weighted PD with risk and stress adjustments, bounded 1%-25%
+    weighted_pd = updates['cds_fee_24h_change'].to_numpy() / updates['total_exposure'].to_numpy()
+    company_risk = risk_multiplier.reindex(updates.index).to_numpy()
+    updates['avg_pd'] = np.clip(weighted_pd * company_risk * market_stress_multiplier, 0.01, 0.25)
+    
+    # Yield and spread follow PD (higher PD = higher yield)
+    updates['yield'] = 30.0 + (updates['avg_pd'] * 100)  # Base 30% + PD adjustment
+    updates['spread_bps'] = (30 + (updates['avg_pd'] * 200)).astype(int)  # Base 30bps + PD adjustment
+    
+    # Credit rating based on PD
+    updates['credit_rating'] = PD_RATINGS[np.searchsorted(PD_RATING_BINS, updates['avg_pd'].to_numpy(), side='right')]
+    
+    # 24h change metrics - this is the key fix!
+    updates['notional_24h_change'] = updates['total_exposure']
+    
+    # Write all updated companies back column by column at their row positions, matching each column's dtype
+    active_rows = np.flatnonzero(company_df['company'].isin(updates.index).to_numpy())
+    updates = updates.reindex(company_df['company'].to_numpy()[active_rows])
+    for column in updates.columns:
+        values = updates[column].to_numpy()
+        if column in COMPANY_COLUMN_DTYPES:
+            values = values.astype(COMPANY_COLUMN_DTYPES[column])
+        company_df.iloc[active_rows, company_df.columns.get_loc(column)] = values
     
     return company_df
 
@@ -576,60 +716,143 @@ def update_company_metrics_from_transactions(company_df, transactions):
 # EXPORT FUNCTIONS
 # ============================================================================
 
-def generate_excel_report():
+def get_protocol_metrics():
+    """Snapshot protocol_df as a {metric: value} dict for O(1) lookups"""
+    return dict(zip(protocol_df['metric'].to_numpy(), protocol_df['value'].to_numpy()))
+
+def get_portfolio_summary(company_df, top_n=5):
+    """Compute the portfolio totals and top obligors shared by the PDF and Excel reports"""
+    exposures = company_df['total_exposure'].to_numpy()
+    top_n = min(top_n, len(exposures))
+    
+    # argpartition finds the top-N in O(N); only those N are then sorted
+    if top_n < len(exposures):
+        top_idx = np.argpartition(-exposures, top_n)[:top_n]
+    else:
+        top_idx = np.arange(len(exposures))
+    top_idx = top_idx[np.argsort(-exposures[top_idx], kind='stable')]
+    
+    return SimpleNamespace(
+        total_exposure=exposures.sum(),
+        avg_yield=company_df['yield'].to_numpy().mean(),
+        num_obligors=len(company_df),
+        top_obligors=company_df.iloc[top_idx]
+    )
+
+# xlsxwriter options: flush rows as written and skip the per-string formula/URL/number scans
+XLSXWRITER_OPTIONS = {
+    'constant_memory': True,
+    'strings_to_formulas': False,
+    'strings_to_urls': False,
+    'strings_to_numbers': False,
+    'default_date_format': 'yyyy-mm-dd hh:mm:ss'
+}
+
+def create_report_workbook(output):
+    """Open a streaming workbook on output using xlsxwriter when installed, else openpyxl"""
+    if XLSXWRITER_AVAILABLE:
+        return xlsxwriter.Workbook(output, XLSXWRITER_OPTIONS)
+    from openpyxl import Workbook  # Deferred: only needed when an Excel export is requested
+    return Workbook(write_only=True)
+
+def write_dataframe_sheet(workbook, df, title):
+    """Stream a DataFrame into a new sheet of a streaming workbook"""
+    header = [str(column) for column in df.columns]
+    
+    # Missing values become empty cells, as with DataFrame.to_excel
+    if df.isna().to_numpy().any():
+        df = df.astype(object).where(df.notna(), None)
+    rows = df.itertuples(index=False, name=None)
+    
+    if XLSXWRITER_AVAILABLE:
+        worksheet = workbook.add_worksheet(title)
+        worksheet.write_row(0, 0, header)
+        for row_number, row in enumerate(rows, start=1):
+            worksheet.write_row(row_number, 0, row)
+    else:
+        worksheet = workbook.create_sheet(title)
+        worksheet.append(header)
+        for row in rows:
+            worksheet.append(row)
+
+def save_report_workbook(workbook, output):
+    """Finish writing the workbook into output"""
+    if XLSXWRITER_AVAILABLE:
+        workbook.close()
+    else:
+        workbook.save(output)
+
+def generate_excel_report(summary=None, now=None):
     """Generate comprehensive Excel report for due diligence"""
-    # Create Excel writer
-    output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        
-        # Protocol Overview
-        protocol_df.to_excel(writer, sheet_name='Protocol_Overview', index=False)
-        
-        # Portfolio Analysis
-        company_df.to_excel(writer, sheet_name='Portfolio_Analysis', index=False)
-        
-        # Price Data
-        brics_price_df.to_excel(writer, sheet_name='Price_Data', index=False)
-        
-        # Risk Metrics
-        risk_df.to_excel(writer, sheet_name='Risk_Metrics', index=False)
-        
-        # Cash Flow Waterfall
-        waterfall_df.to_excel(writer, sheet_name='Cash_Flow_Waterfall', index=False)
-        
-        # BRICS Protocol Summary Sheet
-        summary_data = {
-            'Metric': [
-                'BRICS Protocol Report',
-                'Current $BRICS Price',
-                'Target APY',
-                'Total Portfolio Exposure',
-                'Weighted Portfolio PD',
-                'Capital Efficiency',
-                'Number of Obligors',
-                'Average Yield',
-                'Report Generated',
-                'Contact Information'
-            ],
-            'Value': [
-                BRICS_BRAND['name'],
-                f"${protocol_df[protocol_df['metric'] == 'brics_price']['value'].iloc[0]:.3f}",
-                f"{protocol_df[protocol_df['metric'] == 'apy_per_brics']['value'].iloc[0]:.1f}%",
-                f"${company_df['total_exposure'].sum():,.0f}",
-                f"{protocol_df[protocol_df['metric'] == 'weighted_pd']['value'].iloc[0]*100:.1f}%",
-                f"{protocol_df[protocol_df['metric'] == 'capital_efficiency']['value'].iloc[0]:.1f}x",
-                len(company_df),
-                f"{company_df['yield'].mean():.1f}%",
-                datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                BRICS_BRAND['contact']['email']
-            ]
-        }
-        pd.DataFrame(summary_data).to_excel(writer, sheet_name='BRICS_Executive_Summary', index=False)
+    metrics = get_protocol_metrics()
+    if now is None:
+        now = datetime.now()
+    if summary is None:
+        summary = get_portfolio_summary(company_df)
+    
+    # Reuse one buffer per session; getvalue() below hands back an independent copy
+    output = st.session_state.setdefault('excel_report_buffer', io.BytesIO())
+    output.seek(0)
+    output.truncate(0)
+    
+    # Streaming workbook writes rows out instead of keeping every cell in memory
+    workbook = create_report_workbook(output)
+    
+    # Protocol Overview
+    write_dataframe_sheet(workbook, protocol_df, 'Protocol_Overview')
+    
+    # Portfolio Analysis
+    write_dataframe_sheet(workbook, company_df, 'Portfolio_Analysis')
+    
+    # Price Data
+    write_dataframe_sheet(workbook, brics_price_df, 'Price_Data')
+    
+    # Risk Metrics
+    write_dataframe_sheet(workbook, risk_df, 'Risk_Metrics')
+    
+    # Cash Flow Waterfall
+    write_dataframe_sheet(workbook, waterfall_df, 'Cash_Flow_Waterfall')
+    
+    # BRICS Protocol Summary Sheet
+    summary_data = {
+        'Metric': [
+            'BRICS Protocol Report',
+            'Current $BRICS Price',
+            'Target APY',
+            'Total Portfolio Exposure',
+            'Weighted Portfolio PD',
+            'Capital Efficiency',
+            'Number of Obligors',
+            'Average Yield',
+            'Report Generated',
+            'Contact Information'
+        ],
+        'Value': [
+            BRICS_BRAND['name'],
+            f"${metrics['brics_price']:.3f}",
+            f"{metrics['apy_per_brics']:.1f}%",
+            f"${summary.total_exposure:,.0f}",
+            f"{metrics['weighted_pd']*100:.1f}%",
+            f"{metrics['capital_efficiency']:.1f}x",
+            summary.num_obligors,
+            f"{summary.avg_yield:.1f}%",
+            now.strftime('%Y-%m-%d %H:%M:%S'),
+            BRICS_BRAND['contact']['email']
+        ]
+    }
+    write_dataframe_sheet(workbook, pd.DataFrame(summary_data), 'BRICS_Executive_Summary')
+    
+    save_report_workbook(workbook, output)
     
     return output.getvalue()
 
-def generate_pdf_report():
+def generate_pdf_report(summary=None, now=None):
     """Generate professional BRICS Protocol PDF report for due diligence"""
+    if summary is None:
+        summary = get_portfolio_summary(company_df)
+    generated_at = (now or datetime.now()).strftime('%Y-%m-%d %H:%M:%S')
+    
+    from fpdf import FPDF  # Deferred: only needed when a PDF export is requested
     pdf = FPDF()
     pdf.add_page()
     
@@ -646,8 +869,11 @@ def generate_pdf_report():
     # Report metadata
     pdf.set_font('Arial', '', 10)
     pdf.set_text_color(102, 102, 102)  # Gray
-    pdf.cell(0, 8, f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", ln=True, align='C')
-    pdf.cell(0, 8, f"Contact: {BRICS_BRAND['contact']['email']}", ln=True, align='C')
+    metadata_lines = [
+        f"Report Generated: {generated_at}",
+        f"Contact: {BRICS_BRAND['contact']['email']}"
+    ]
+    pdf.multi_cell(0, 8, "\n".join(metadata_lines), align='C')
     pdf.ln(10)
     
     # Executive Summary
@@ -655,21 +881,21 @@ def generate_pdf_report():
     pdf.cell(0, 10, 'Executive Summary', ln=True)
     pdf.set_font('Arial', '', 12)
     
-    current_price = protocol_df[protocol_df['metric'] == 'brics_price']['value'].iloc[0]
-    apy = protocol_df[protocol_df['metric'] == 'apy_per_brics']['value'].iloc[0]
-    total_exposure = company_df['total_exposure'].sum()
+    metrics = get_protocol_metrics()
+    current_price = metrics['brics_price']
+    apy = metrics['apy_per_brics']
+    total_exposure = summary.total_exposure
     
-    summary_text = f"""
-    Current $BRICS Price: ${current_price:.3f}
-    Target APY: {apy:.1f}%
-    Total Portfolio Exposure: ${total_exposure:,.0f}
-    Number of Obligors: {len(company_df)}
-    Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-    """
+    summary_lines = [
+        f"Current $BRICS Price: ${current_price:.3f}",
+        f"Target APY: {apy:.1f}%",
+        f"Total Portfolio Exposure: ${total_exposure:,.0f}",
+        f"Number of Obligors: {summary.num_obligors}",
+        f"Report Generated: {generated_at}"
+    ]
     
-    for line in summary_text.strip().split('\n'):
-        if line.strip():
-            pdf.cell(0, 8, line.strip(), ln=True)
+    # One multi_cell per block resolves the font state once instead of once per line
+    pdf.multi_cell(0, 8, "\n".join(summary_lines), align='L')
     
     pdf.ln(10)
     
@@ -679,30 +905,52 @@ def generate_pdf_report():
     pdf.set_font('Arial', '', 12)
     
     # Top 5 obligors
-    top_obligors = company_df.nlargest(5, 'total_exposure')
-    for _, row in top_obligors.iterrows():
-        pdf.cell(0, 8, f"{row['company']}: ${row['total_exposure']:,.0f} ({row['yield']:.1f}% yield)", ln=True)
+    top_obligors = summary.top_obligors
+    obligor_lines = [
+        f"{company}: ${exposure:,.0f} ({obligor_yield:.1f}% yield)"
+        for company, exposure, obligor_yield in zip(top_obligors['company'], top_obligors['total_exposure'], top_obligors['yield'])
+    ]
+    pdf.multi_cell(0, 8, "\n".join(obligor_lines), align='L')
     
-    return pdf.output(dest='S').encode('latin-1')
+    return pdf.output(dest='S').encode('latin-1', 'replace')
+
+@st.cache_data(show_spinner=False)
+def build_csv_bytes(df):
+    """Encode a DataFrame as CSV once per distinct content"""
+    return df.to_csv(index=False, lineterminator='\n').encode('utf-8')
+
+def stamp_price_csv_export(csv_bytes, timestamp):
+    """Append an export_timestamp column to the encoded brics_price_df CSV from build_csv_bytes.
+
+    Only for that export: it splits rows on every newline, which is safe because the price frame holds
+    just timestamps and numbers (no quoted fields), and a Timestamp's text needs no CSV quoting.
+    """
+    header, body = csv_bytes.split(b'\n', 1)
+    return header + b",export_timestamp\n" + body.replace(b'\n', f",{pd.Timestamp(timestamp)}\n".encode('utf-8'))
 
+@st.fragment
 def create_export_buttons():
-    """Create export buttons for the dashboard"""
+    """Create export buttons for the dashboard; as a fragment, a click reruns only this section"""
     st.markdown("""
     <div class="section-card">
         <div class="section-header">📊 EXPORT REPORTS</div>
     </div>
     """, unsafe_allow_html=True)
     
+    # One timestamp per render keeps report contents and download file names in step
+    now = datetime.now()
+    file_stamp = now.strftime('%Y%m%d_%H%M%S')
+    
     col1, col2, col3 = st.columns(3)
     
     with col1:
         if st.button("📄 Generate PDF Report", type="primary"):
             try:
-                pdf_bytes = generate_pdf_report()
+                pdf_bytes = generate_pdf_report(now=now)
                 st.download_button(
                     label="📥 Download PDF Report",
                     data=pdf_bytes,
-                    file_name=f"BRICS_Investment_Report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
+                    file_name=f"BRICS_Investment_Report_{file_stamp}.pdf",
                     mime="application/pdf"
                 )
                 st.success("✅ PDF report generated successfully!")
@@ -712,11 +960,11 @@ def create_export_buttons():
     with col2:
         if st.button("📊 Generate Excel Report", type="primary"):
             try:
-                excel_bytes = generate_excel_report()
+                excel_bytes = generate_excel_report(now=now)
                 st.download_button(
                     label="📥 Download Excel Report",
                     data=excel_bytes,
-                    file_name=f"BRICS_Investment_Report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+                    file_name=f"BRICS_Investment_Report_{file_stamp}.xlsx",
                     mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
                 )
                 st.success("✅ Excel report generated successfully!")
@@ -726,80 +974,64 @@ def create_export_buttons():
     with col3:
         if st.button("📈 Export Chart Data", type="primary"):
             try:
-                # Export current price chart data
-                chart_data = brics_price_df.copy()
-                chart_data['export_timestamp'] = datetime.now()
-                
-                csv_bytes = chart_data.to_csv(index=False).encode('utf-8')
+                # Export current price chart data; only the timestamp column is rebuilt per click
+                csv_bytes = stamp_price_csv_export(build_csv_bytes(brics_price_df), now)
                 st.download_button(
                     label="📥 Download Chart Data (CSV)",
                     data=csv_bytes,
-                    file_name=f"BRICS_Price_Data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                    file_name=f"BRICS_Price_Data_{file_stamp}.csv",
                     mime="text/csv"
                 )
                 st.success("✅ Chart data exported successfully!")
             except Exception as e:
                 st.error(f"❌ Error exporting data: {str(e)}")
 
+# Alert type, message template and icon keyed by (check, code); checks are price, APY, risk
+ALERT_TEMPLATES = {
+    (0, 1): ('warning', "⚠️ High price volatility: ${current_price:.3f} ({price_change:.1f}% from peg)", '🔴'),
+    (0, 2): ('info', "📊 Price movement: ${current_price:.3f} ({price_change:.1f}% from peg)", '🟡'),
+    (1, 1): ('warning', "📉 Low APY: {apy:.1f}% (below target range)", '🔴'),
+    (1, 2): ('info', "📈 High APY: {apy:.1f}% (above target range)", '🟢'),
+    (2, 1): ('error', "🚨 High portfolio risk: {weighted_pd_pct:.1f}% PD", '🔴')
+}
+
 def check_alerts():
     """Check for real-time alerts and notifications"""
     alerts = []
+    metrics = get_protocol_metrics()
     
-    # Price alerts
-    current_price = protocol_df[protocol_df['metric'] == 'brics_price']['value'].iloc[0]
+    current_price = metrics['brics_price']
     price_change = abs(current_price - 1.00) / 1.00 * 100
+    apy = metrics['apy_per_brics']
+    weighted_pd = metrics['weighted_pd']
+    
+    # Price, APY and risk checks in one pass: 1 = primary threshold breached, 2 = secondary
+    alert_codes = np.select(
+        [
+            np.array([price_change > 5, apy < 25, weighted_pd > 0.12]),
+            np.array([price_change > 2, apy > 40, False])
+        ],
+        [1, 2],
+        0
+    )
     
-    if price_change > 5:
-        alerts.append({
-            'type': 'warning',
-            'message': f"⚠️ High price volatility: ${current_price:.3f} ({price_change:.1f}% from peg)",
-            'icon': '🔴'
-        })
-    elif price_change > 2:
-        alerts.append({
-            'type': 'info',
-            'message': f"📊 Price movement: ${current_price:.3f} ({price_change:.1f}% from peg)",
-            'icon': '🟡'
-        })
-    
-    # APY alerts
-    apy = protocol_df[protocol_df['metric'] == 'apy_per_brics']['value'].iloc[0]
-    if apy < 25:
-        alerts.append({
-            'type': 'warning',
-            'message': f"📉 Low APY: {apy:.1f}% (below target range)",
-            'icon': '🔴'
-        })
-    elif apy > 40:
-        alerts.append({
-            'type': 'info',
-            'message': f"📈 High APY: {apy:.1f}% (above target range)",
-            'icon': '🟢'
-        })
-    
-    # Risk alerts
-    weighted_pd = protocol_df[protocol_df['metric'] == 'weighted_pd']['value'].iloc[0]
-    if weighted_pd > 0.12:
-        alerts.append({
-            'type': 'error',
-            'message': f"🚨 High portfolio risk: {weighted_pd*100:.1f}% PD",
-            'icon': '🔴'
-        })
+    for check_index, code in enumerate(alert_codes):
+        if code:
+            alert_type, template, icon = ALERT_TEMPLATES[(check_index, int(code))]
+            alerts.append({
+                'type': alert_type,
+                'message': template.format(current_price=current_price, price_change=price_change, apy=apy, weighted_pd_pct=weighted_pd * 100),
+                'icon': icon
+            })
     
-    # Performance alerts
-    if 'performance_summary' in globals():
-        try:
-            performance_summary = performance_monitor.get_performance_summary()
-            if 'current_metrics' in performance_summary:
-                cpu_usage = performance_summary['current_metrics'].get('cpu_percent', 0)
-                if cpu_usage > 80:
-                    alerts.append({
-                        'type': 'warning',
-                        'message': f"⚡ High CPU usage: {cpu_usage:.1f}%",
-                        'icon': '🟡'
-                    })
-        except:
-            pass
+    # Performance alerts reuse the monitor's threshold checks on its latest sample
+    for perf_alert in performance_monitor.get_performance_alerts():
+        if perf_alert['metric'] == 'CPU Usage':
+            alerts.append({
+                'type': 'warning',
+                'message': f"⚡ High CPU usage: {perf_alert['value']}",
+                'icon': '🟡'
+            })
     
     return alerts
 
@@ -861,10 +1093,14 @@ def show_success_state(message="Operation completed successfully!"):
     </div>
     """, unsafe_allow_html=True)
 
-def create_branded_header():
-    """Create BRICS Protocol branded header"""
-    # Create the header HTML with proper escaping
-    header_html = f"""
+def compact_html(markup):
+    """Strip indentation and blank lines so st.markdown renders the markup as raw HTML"""
+    return "\n".join(line.strip() for line in markup.splitlines() if line.strip())
+
+@st.cache_data(show_spinner=False)
+def build_header_html():
+    """Build the branded header HTML once; it only depends on brand constants"""
+    return compact_html(f"""
     <div class="brics-header">
         <div class="brics-logo">
             {BRICS_LOGO_HTML}
@@ -876,13 +1112,16 @@ def create_branded_header():
             <a href="{BRICS_BRAND['contact']['website']}" class="brics-cta" target="_blank">🌐 Visit Website</a>
         </div>
     </div>
-    """
-    
-    html(header_html, height=200)
+    """)
 
-def create_contact_footer():
-    """Create BRICS Protocol contact footer"""
-    footer_html = f"""
+def create_branded_header():
+    """Create BRICS Protocol branded header"""
+    st.markdown(build_header_html(), unsafe_allow_html=True)
+
+@st.cache_data(show_spinner=False)
+def build_footer_html():
+    """Build the contact footer HTML once; it only depends on brand constants"""
+    return compact_html(f"""
     <div style="background: rgba(255,255,255,0.95); padding: 2rem; border-radius: 1rem; margin-top: 2rem; box-shadow: 0 4px 20px rgba(0,0,0,0.08);">
         <div style="text-align: center; margin-bottom: 1rem;">
             <h4 style="margin: 0; color: {BRICS_COLORS['primary']}; font-weight: 600; font-family: {BRICS_FONTS['heading']};">📋 Important Disclaimers</h4>
@@ -905,211 +1144,389 @@ def create_contact_footer():
             </div>
         </div>
     </div>
+    """)
+
+@st.cache_resource(show_spinner=False)
+def build_sidebar_html():
+    """Build the sidebar brand block once per process; the string is immutable so it is shared, not copied"""
+    return f"""
+    <div style="padding: 1rem 0; text-align: center;">
+        <div style="margin-bottom: 1rem;">
+            {BRICS_LOGO_HTML}
+        </div>
+        <h3 style="margin: 0; color: {BRICS_COLORS['primary']}; font-weight: 600; font-family: {BRICS_FONTS['heading']};">{BRICS_BRAND['name']}</h3>
+        <p style="margin: 0.5rem 0; font-size: 0.9rem; color: {BRICS_COLORS['neutral']}; font-family: {BRICS_FONTS['body']};">{BRICS_BRAND['tagline']}</p>
+    </div>
     """
-    
-    html(footer_html, height=150)
 
-st.set_page_config(
-    page_title="$BRICS Investment Report", 
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+@st.cache_data(show_spinner=False)
+def build_invest_cta_html():
+    """Build the "Ready to Invest" call-to-action HTML once; it only depends on brand constants"""
+    return f"""
+    <div style="background: linear-gradient(135deg, {BRICS_COLORS['primary']} 0%, {BRICS_COLORS['secondary']} 100%); 
+                color: {BRICS_COLORS['white']}; padding: 2rem; border-radius: 1rem; margin: 2rem 0; 
+                text-align: center; box-shadow: 0 8px 32px rgba(0,0,0,0.1);">
+        <h3 style="margin: 0 0 1rem 0; font-family: {BRICS_FONTS['heading']}; font-size: 1.5rem;">
+            Ready to Invest in $BRICS?
+        </h3>
+        <p style="margin: 0 0 1.5rem 0; opacity: 0.9; font-family: {BRICS_FONTS['body']};">
+            Get in touch with our investor relations team for detailed due diligence materials and investment opportunities.
+        </p>
+        <div style="display: flex; justify-content: center; gap: 1rem; flex-wrap: wrap;">
+            <a href="mailto:{BRICS_BRAND['contact']['email']}" class="brics-cta">📧 Contact Founders</a>
+            <a href="{BRICS_BRAND['contact']['website']}" class="brics-cta" target="_blank">�� Visit Website</a>
+            <a href="{BRICS_BRAND['contact']['linkedin']}" class="brics-cta" target="_blank">💼 LinkedIn</a>
+        </div>
+    </div>
+    """
 
-# Custom CSS for BRICS Protocol branding
-st.markdown(f"""
-<style>
-    /* Import Google Fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    @import url('https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;500&display=swap');
-    
-    /* Global Styles */
-    .main {{
-        background: linear-gradient(135deg, {BRICS_COLORS['gradient_start']} 0%, {BRICS_COLORS['gradient_end']} 100%);
-        padding: 0;
-        font-family: {BRICS_FONTS['body']};
-    }}
-    
-    /* BRICS Protocol Branding */
-    .brics-header {{
-        background: linear-gradient(135deg, {BRICS_COLORS['primary']} 0%, {BRICS_COLORS['secondary']} 100%);
-        color: {BRICS_COLORS['white']};
-        padding: 2rem;
-        border-radius: 1rem;
-        margin-bottom: 2rem;
-        box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-        border: 1px solid rgba(255,255,255,0.1);
-        text-align: center;
-    }}
-    
-    .brics-logo {{
-        display: inline-block;
-        margin-bottom: 1rem;
-    }}
-    
-    .brics-title {{
-        font-family: {BRICS_FONTS['heading']};
-        font-size: 2.5rem;
-        font-weight: 700;
-        margin: 0;
-        color: {BRICS_COLORS['white']};
-    }}
-    
-    .brics-tagline {{
-        font-family: {BRICS_FONTS['body']};
-        font-size: 1.1rem;
-        opacity: 0.9;
-        margin: 0.5rem 0;
-        color: {BRICS_COLORS['white']};
-    }}
-    
-    .brics-cta {{
-        background: {BRICS_COLORS['accent']};
-        color: {BRICS_COLORS['white']};
-        padding: 0.75rem 1.5rem;
-        border-radius: 0.5rem;
-        text-decoration: none;
-        font-weight: 600;
-        display: inline-block;
-        margin: 1rem 0.5rem;
-        transition: all 0.3s ease;
-    }}
-    
-    .brics-cta:hover {{
-        background: {BRICS_COLORS['primary']};
-        transform: translateY(-2px);
-        box-shadow: 0 4px 12px rgba(0,0,0,0.2);
-    }}
-    
-    /* Grid System */
-    .grid-container {{
-        display: grid;
-        gap: 1.5rem;
-        margin: 1rem 0;
-    }}
-    
-    .grid-2x2 {{
-        grid-template-columns: 1fr 1fr;
-        grid-template-rows: 1fr 1fr;
-    }}
-    
-    .grid-3x3 {{
-        grid-template-columns: 1fr 1fr 1fr;
-        grid-template-rows: 1fr 1fr 1fr;
-    }}
-    
-    .grid-2x3 {{
-        grid-template-columns: 1fr 1fr;
-        grid-template-rows: 1fr 1fr 1fr;
-    }}
-    
-    /* Section Cards */
-    .section-card {{
-        background: rgba(255,255,255,0.95);
-        padding: 1.5rem;
-        border-radius: 1rem;
-        border: 1px solid rgba(0,0,0,0.1);
-        box-shadow: 0 4px 20px rgba(0,0,0,0.08);
-        margin-bottom: 1.5rem;
-    }}
-    
-    .section-header {{
-        font-size: 1.4rem;
-        font-weight: 600;
-        color: {BRICS_COLORS['primary']};
-        margin-bottom: 1rem;
-        padding-bottom: 0.5rem;
-        border-bottom: 2px solid {BRICS_COLORS['secondary']};
-        font-family: {BRICS_FONTS['heading']};
-    }}
-    
-    /* Metric Cards */
-    .metric-card {{
-        background: rgba(255,255,255,0.95);
-        padding: 1.5rem;
-        border-radius: 1rem;
-        border-left: 6px solid #667eea;
-        margin: 1rem 0;
-        box-shadow: 0 4px 20px rgba(0,0,0,0.08);
-        transition: transform 0.2s ease;
-    }}
-    
-    .metric-card:hover {{
-        transform: translateY(-2px);
-        box-shadow: 0 8px 25px rgba(0,0,0,0.12);
-    }}
-    
-    /* Header Styling */
-    .main-header {{
-        background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
+# Dashboard price hero; only the price and live status change between reruns
+PRICE_HERO_TEMPLATE = """
+    <div style="background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%); 
+                color: white; padding: 2rem; border-radius: 1rem; margin: 1rem 0; 
+                text-align: center; box-shadow: 0 8px 32px rgba(0,0,0,0.1);">
+        <h2 style="margin: 0; font-size: 1.2rem; opacity: 0.9;">Sovereign-Backed $BRICS</h2>
+        <h1 style="margin: 0.5rem 0; font-size: 3.5rem; font-weight: 700;">${price:.3f}</h1>
+        <p style="margin: 0; font-size: 1.1rem; opacity: 0.9;">
+            Super Senior Tranche • CDS Premium Yield • {status}
+        </p>
+        <p style="margin: 0.5rem 0; font-size: 0.9rem; opacity: 0.8;">
+            South African Treasury Backed • FAIS FSP #52815 • Basel III SRT Compliant
+        </p>
+    </div>
+    """
+
+# Dashboard investment summary: section header and the three info boxes below it
+SECTION_HEADER_SUMMARY_HTML = """
+    <div class="section-header">
+        <h2 style="margin: 0; font-size: 1.8rem; font-weight: 600;">
+            💰 Investment Summary
+        </h2>
+        <p style="margin: 0.5rem 0 0 0; opacity: 0.9; font-size: 1rem;">
+            Key investment highlights and risk protection mechanisms
+        </p>
+    </div>
+    """
+
+INFO_BOX_YIELD_HTML = """
+        <div class="info-box" style="border-left-color: #28a745;">
+            <h4 style="margin: 0 0 1rem 0; color: #28a745; font-weight: 600;">📈 Yield Sources</h4>
+            <ul style="margin: 0; padding-left: 1.5rem;">
+                <li><strong>CDS Premiums:</strong> 2.14% monthly</li>
+                <li><strong>Sovereign Yield:</strong> 0.73% monthly</li>
+                <li><strong>Total:</strong> 2.87% monthly (34.4% APY)</li>
+            </ul>
+        </div>
+        """
+
+INFO_BOX_RISK_HTML = """
+        <div class="info-box" style="border-left-color: #ffc107;">
+            <h4 style="margin: 0 0 1rem 0; color: #ffc107; font-weight: 600;">🛡️ Risk Protection</h4>
+            <ul style="margin: 0; padding-left: 1.5rem;">
+                <li><strong>Overcollateralization:</strong> 11.5%</li>
+                <li><strong>Sovereign Guarantee:</strong> First-loss protection</li>
+                <li><strong>Institutional Buffer:</strong> Underwriting protection</li>
+            </ul>
+        </div>
+        """
+
+INFO_BOX_HIGHLIGHTS_HTML = """
+        <div class="info-box" style="border-left-color: #17a2b8;">
+            <h4 style="margin: 0 0 1rem 0; color: #17a2b8; font-weight: 600;">✨ Investment Highlights</h4>
+            <ul style="margin: 0; padding-left: 1.5rem;">
+                <li><strong>No leverage</strong> or borrowing</li>
+                <li><strong>Monthly redemptions</strong> available</li>
+                <li><strong>$10,000 minimum</strong> investment</li>
+            </ul>
+        </div>
+        """
+
+SECTION_HEADER_UE_HTML = """
+    <div class="section-header">
+        <h1 style="margin: 0; font-size: 2.2rem; font-weight: 700; color: #1e3c72;">
+            💰 UNIT ECONOMICS
+        </h1>
+    </div>
+    """
+
+@st.cache_data(show_spinner=False)
+def build_investment_summary_html():
+    """Build the investment summary header and its three equal-width info boxes as one HTML payload"""
+    return compact_html(f"""
+    {SECTION_HEADER_SUMMARY_HTML}
+    <div style="display: flex; gap: 1rem; align-items: stretch; flex-wrap: wrap;">
+        <div style="flex: 1; min-width: 240px;">{INFO_BOX_YIELD_HTML}</div>
+        <div style="flex: 1; min-width: 240px;">{INFO_BOX_RISK_HTML}</div>
+        <div style="flex: 1; min-width: 240px;">{INFO_BOX_HIGHLIGHTS_HTML}</div>
+    </div>
+    """)
+
+# Static documentation blocks; lists are set off by blank lines so any Markdown renderer reads them as lists
+BRICS_MECHANICS_MD = """
+### How $BRICS Works
+
+1. **Banks pool trade receivables** from investment-grade corporates (30-180 day tenor)
+2. **CDS contracts transfer credit risk** to the protocol for regulatory capital relief
+3. **$BRICS tokenizes the super-senior tranche** (76% of notional)
+4. **Investors receive monthly CDS premiums** + sovereign yield
+5. **Redemption via token burn** distributes yield pro rata
+"""
+
+INVESTMENT_EXAMPLE_MD = """
+**For every $1,000 invested in $BRICS:**
+
+- **Notional Exposure**: $8,700 (8.7x leverage)
+- **Monthly Yield**: $28.70 (2.87% monthly)
+- **Annual Yield**: $344.40 (34.4% APY)
+- **Risk Buffer**: $115 (11.5% overcollateralization)
+- **Sovereign Protection**: $82 (first-loss guarantee)
+"""
+
+APY_CALCULATION_MD = """
+**APY Calculation:**
+
+- Monthly Yield: 2.87% (CDS 2.14% + Sovereign 0.73%)
+- Annualized: 2.87% × 12 = **34.4% APY**
+- Portfolio Average: 33.2% (weighted by obligor exposure)
+"""
+
+TRANSACTION_PATTERN_MD = """
+**Curated Portfolio System:**
+
+- **Per Update (3 seconds)**: 2-5 transactions (curated selection)
+- **Per Minute**: ~20-30 companies get transactions
+- **Per Hour**: ~80-90 companies get transactions  
+- **Per Day**: ~95-100 companies get transactions
+
+**Why This Reflects Private Placement:**
+
+- **Selective Obligor Choice**: We choose active, creditworthy companies
+- **Weighted Selection**: Larger companies (COMP_1-30) are 3x more likely to be selected
+- **Quality Focus**: Medium companies (COMP_31-60) are 2x more likely
+- **Activity-Based**: All selected obligors should show regular transaction activity
+"""
+
+RISK_MODELS_MD = """
+### AI/ML Risk Models
+
+**XGBoost Credit Scoring**: Analyzes 2M+ datapoints to calculate probability of default for each obligor.
+
+**Lévy Copula Tail Risk**: Models joint default risk and extreme tail events across the portfolio.
+
+**Real-Time Pricing**: CDS premiums calculated dynamically based on risk signals and market conditions.
+"""
+
+@st.cache_resource(show_spinner=False)
+def static_doc_html(markdown_text):
+    """Render a static documentation block to HTML once per process, or return the Markdown if no renderer is installed"""
+    text = textwrap.dedent(markdown_text).strip()
+    if MARKDOWN_AVAILABLE:
+        return markdown.markdown(text)
+    return text
+
+def render_static_doc(markdown_text):
+    """Emit a static documentation block from its cached rendering"""
+    st.markdown(static_doc_html(markdown_text), unsafe_allow_html=True)
+
+def create_contact_footer():
+    """Create BRICS Protocol contact footer"""
+    st.markdown(build_footer_html(), unsafe_allow_html=True)
+
+# Branded stylesheet with $name placeholders for the brand colours and fonts
+BRAND_CSS_TEMPLATE = string.Template("""
+<style>
+    /* Import Google Fonts */
+    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
+    @import url('https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;500&display=swap');
+    
+    /* Global Styles */
+    .main {
+        background: linear-gradient(135deg, $gradient_start 0%, $gradient_end 100%);
+        padding: 0;
+        font-family: $body_font;
+    }
+    
+    /* BRICS Protocol Branding */
+    .brics-header {
+        background: linear-gradient(135deg, $primary 0%, $secondary 100%);
+        color: $white;
+        padding: 2rem;
+        border-radius: 1rem;
+        margin-bottom: 2rem;
+        box-shadow: 0 8px 32px rgba(0,0,0,0.1);
+        border: 1px solid rgba(255,255,255,0.1);
+        text-align: center;
+    }
+    
+    .brics-logo {
+        display: inline-block;
+        margin-bottom: 1rem;
+    }
+    
+    .brics-title {
+        font-family: $heading_font;
+        font-size: 2.5rem;
+        font-weight: 700;
+        margin: 0;
+        color: $white;
+    }
+    
+    .brics-tagline {
+        font-family: $body_font;
+        font-size: 1.1rem;
+        opacity: 0.9;
+        margin: 0.5rem 0;
+        color: $white;
+    }
+    
+    .brics-cta {
+        background: $accent;
+        color: $white;
+        padding: 0.75rem 1.5rem;
+        border-radius: 0.5rem;
+        text-decoration: none;
+        font-weight: 600;
+        display: inline-block;
+        margin: 1rem 0.5rem;
+        transition: all 0.3s ease;
+    }
+    
+    .brics-cta:hover {
+        background: $primary;
+        transform: translateY(-2px);
+        box-shadow: 0 4px 12px rgba(0,0,0,0.2);
+    }
+    
+    /* Grid System */
+    .grid-container {
+        display: grid;
+        gap: 1.5rem;
+        margin: 1rem 0;
+    }
+    
+    .grid-2x2 {
+        grid-template-columns: 1fr 1fr;
+        grid-template-rows: 1fr 1fr;
+    }
+    
+    .grid-3x3 {
+        grid-template-columns: 1fr 1fr 1fr;
+        grid-template-rows: 1fr 1fr 1fr;
+    }
+    
+    .grid-2x3 {
+        grid-template-columns: 1fr 1fr;
+        grid-template-rows: 1fr 1fr 1fr;
+    }
+    
+    /* Section Cards */
+    .section-card {
+        background: rgba(255,255,255,0.95);
+        padding: 1.5rem;
+        border-radius: 1rem;
+        border: 1px solid rgba(0,0,0,0.1);
+        box-shadow: 0 4px 20px rgba(0,0,0,0.08);
+        margin-bottom: 1.5rem;
+    }
+    
+    .section-header {
+        font-size: 1.4rem;
+        font-weight: 600;
+        color: $primary;
+        margin-bottom: 1rem;
+        padding-bottom: 0.5rem;
+        border-bottom: 2px solid $secondary;
+        font-family: $heading_font;
+    }
+    
+    /* Metric Cards */
+    .metric-card {
+        background: rgba(255,255,255,0.95);
+        padding: 1.5rem;
+        border-radius: 1rem;
+        border-left: 6px solid #667eea;
+        margin: 1rem 0;
+        box-shadow: 0 4px 20px rgba(0,0,0,0.08);
+        transition: transform 0.2s ease;
+    }
+    
+    .metric-card:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 8px 25px rgba(0,0,0,0.12);
+    }
+    
+    /* Header Styling */
+    .main-header {
+        background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
         color: white;
         padding: 2rem;
         border-radius: 1rem;
         margin-bottom: 2rem;
         box-shadow: 0 8px 32px rgba(0,0,0,0.1);
         border: 1px solid rgba(255,255,255,0.1);
-    }}
+    }
     
     /* Status Indicators */
-    .status-indicator {{
+    .status-indicator {
         font-size: 1.3rem;
         font-weight: bold;
         padding: 0.5rem 1rem;
         border-radius: 2rem;
         display: inline-block;
-    }}
+    }
     
-    .status-stable {{
+    .status-stable {
         background: linear-gradient(135deg, #56ab2f 0%, #a8e6cf 100%);
         color: white;
-    }}
+    }
     
-    .status-volatile {{
+    .status-volatile {
         background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
         color: white;
-    }}
+    }
     
-    .status-stress {{
+    .status-stress {
         background: linear-gradient(135deg, #ff416c 0%, #ff4b2b 100%);
         color: white;
-    }}
+    }
     
     /* Live Indicator */
-    .live-indicator {{
+    .live-indicator {
         animation: pulse 2s infinite;
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
         color: white;
         padding: 0.5rem 1rem;
         border-radius: 2rem;
         font-weight: bold;
-    }}
+    }
     
-    @keyframes pulse {{
-        0%% {{ opacity: 1; transform: scale(1); }}
-        50%% {{ opacity: 0.8; transform: scale(1.05); }}
-        100%% {{ opacity: 1; transform: scale(1); }}
-    }}
+    @keyframes pulse {
+        0% { opacity: 1; transform: scale(1); }
+        50% { opacity: 0.8; transform: scale(1.05); }
+        100% { opacity: 1; transform: scale(1); }
+    }
     
     /* Tab Styling */
-    .stTabs [data-baseweb="tab-list"] {{
+    .stTabs [data-baseweb="tab-list"] {
         gap: 8px;
-    }}
+    }
     
-    .stTabs [data-baseweb="tab"] {{
+    .stTabs [data-baseweb="tab"] {
         background: rgba(255,255,255,0.9);
         border-radius: 0.5rem 0.5rem 0 0;
         padding: 1rem 1.5rem;
         font-weight: 600;
         transition: all 0.3s ease;
-    }}
+    }
     
-    .stTabs [aria-selected="true"] {{
+    .stTabs [aria-selected="true"] {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
         color: white;
         box-shadow: 0 4px 15px rgba(102,126,234,0.4);
-    }}
+    }
     
     /* Section Headers */
-    .section-header {{
+    .section-header {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
         color: white;
         padding: 1rem 1.5rem;
@@ -1117,29 +1534,29 @@ st.markdown(f"""
         margin: 1.5rem 0 1rem 0;
         font-weight: 600;
         box-shadow: 0 4px 15px rgba(102,126,234,0.2);
-    }}
+    }
     
     /* Info Boxes */
-    .info-box {{
+    .info-box {
         background: rgba(255,255,255,0.95);
         padding: 1.5rem;
         border-radius: 1rem;
         border-left: 6px solid #667eea;
         margin: 1rem 0;
         box-shadow: 0 4px 20px rgba(0,0,0,0.08);
-    }}
+    }
     
     /* Chart Containers */
-    .chart-container {{
+    .chart-container {
         background: rgba(255,255,255,0.95);
         padding: 1.5rem;
         border-radius: 1rem;
         margin: 1rem 0;
         box-shadow: 0 4px 20px rgba(0,0,0,0.08);
-    }}
+    }
     
     /* Button Styling */
-    .stButton > button {{
+    .stButton > button {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
         color: white;
         border: none;
@@ -1148,88 +1565,88 @@ st.markdown(f"""
         font-weight: 600;
         transition: all 0.3s ease;
         box-shadow: 0 4px 15px rgba(102,126,234,0.3);
-    }}
+    }
     
-    .stButton > button:hover {{
+    .stButton > button:hover {
         transform: translateY(-2px);
         box-shadow: 0 8px 25px rgba(102,126,234,0.4);
-    }}
+    }
     
     /* Metric Styling */
-    .metric-value {{
+    .metric-value {
         font-size: 2rem;
         font-weight: bold;
         color: #1e3c72;
-    }}
+    }
     
-    .metric-label {{
+    .metric-label {
         font-size: 0.9rem;
         color: #666;
         text-transform: uppercase;
         letter-spacing: 0.5px;
-    }}
+    }
     
     /* Custom Scrollbar */
-    ::-webkit-scrollbar {{
+    ::-webkit-scrollbar {
         width: 8px;
-    }}
+    }
     
-    ::-webkit-scrollbar-track {{
+    ::-webkit-scrollbar-track {
         background: #f1f1f1;
         border-radius: 4px;
-    }}
+    }
     
-    ::-webkit-scrollbar-thumb {{
+    ::-webkit-scrollbar-thumb {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
         border-radius: 4px;
-    }}
+    }
     
-    ::-webkit-scrollbar-thumb:hover {{
+    ::-webkit-scrollbar-thumb:hover {
         background: linear-gradient(135deg, #5a6fd8 0%, #6a4190 100%);
-    }}
+    }
     
     /* Mobile Responsiveness */
-    @media (max-width: 768px) {{
-        .main-header {{
+    @media (max-width: 768px) {
+        .main-header {
             padding: 1rem;
             margin-bottom: 1rem;
-        }}
+        }
         
-        .section-card {{
+        .section-card {
             padding: 1rem;
             margin-bottom: 1rem;
-        }}
+        }
         
-        .section-header {{
+        .section-header {
             font-size: 1.2rem;
-        }}
+        }
         
-        .metric-card {{
+        .metric-card {
             padding: 1rem;
             margin: 0.5rem 0;
-        }}
+        }
         
         /* Stack columns on mobile */
-        .stColumns > div {{
+        .stColumns > div {
             width: 100% !important;
             margin-bottom: 1rem;
-        }}
+        }
         
         /* Adjust chart containers */
-        .chart-container {{
+        .chart-container {
             padding: 0.5rem;
-        }}
+        }
         
         /* Make buttons more touch-friendly */
-        .stButton > button {{
+        .stButton > button {
             width: 100%;
             height: 3rem;
             font-size: 1rem;
-        }}
-    }}
+        }
+    }
     
     /* Loading States */
-    .loading-container {{
+    .loading-container {
         display: flex;
         justify-content: center;
         align-items: center;
@@ -1237,39 +1654,103 @@ st.markdown(f"""
         background: rgba(255,255,255,0.9);
         border-radius: 1rem;
         margin: 1rem 0;
-    }}
+    }
     
     /* Error States */
-    .error-container {{
+    .error-container {
         background: rgba(255,0,0,0.1);
         border: 1px solid #ff0000;
         border-radius: 0.5rem;
         padding: 1rem;
         margin: 1rem 0;
-    }}
+    }
     
     /* Success States */
-    .success-container {{
+    .success-container {
         background: rgba(0,255,0,0.1);
         border: 1px solid #00ff00;
         border-radius: 0.5rem;
         padding: 1rem;
         margin: 1rem 0;
-    }}
+    }
 </style>
-""", unsafe_allow_html=True)
+""")
+
+@st.cache_data(show_spinner=False)
+def build_brand_css(colors, fonts):
+    """Build the branded stylesheet once per colour/font scheme"""
+    fonts = dict(fonts)
+    return BRAND_CSS_TEMPLATE.substitute(dict(colors), heading_font=fonts['heading'], body_font=fonts['body'])
+
+st.set_page_config(
+    page_title="$BRICS Investment Report", 
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Custom CSS for BRICS Protocol branding (cached, so reruns skip re-formatting the stylesheet)
+st.markdown(build_brand_css(tuple(BRICS_COLORS.items()), tuple(BRICS_FONTS.items())), unsafe_allow_html=True)
+
+# Mock data files loaded at startup
+MOCK_DATA_FILES = {
+    'static_company': "data/mock_company_summary.csv",
+    'protocol': "data/mock_protocol_metrics.csv",
+    'risk': "data/mock_risk_outputs.csv",
+    'waterfall': "data/mock_waterfall.csv",
+    'portfolio_tranching': "data/mock_portfolio_tranching.csv",
+    'transactions': "data/mock_transactions.csv",
+    'brics_price': "data/mock_brics_price.csv",
+    'transactions_extended': "data/mock_transactions_extended.csv"
+}
+
+# Date columns parsed once at load so pages don't re-convert them on every rerun; explicit
+# formats skip per-column format inference and keep the columns datetime64
+MOCK_DATA_DATE_COLUMNS = {
+    'brics_price': {'timestamp': '%Y-%m-%d %H:%M:%S'},
+    'transactions_extended': {'date': '%Y-%m-%d'}
+}
+
+# Key column to index each frame by; the column is kept so exports and mask reads are unchanged
+MOCK_DATA_INDEX_COLUMNS = {
+    'protocol': 'metric',  # Unique metric index for O(1) .at reads and writes
+    'risk': 'company'  # One model-output row per obligor, read with .loc in obligor details
+}
+
+def read_mock_csv(name, path):
+    """Read one mock CSV with its date columns already parsed and its key column indexed"""
+    date_formats = MOCK_DATA_DATE_COLUMNS.get(name, {})
+    df = pd.read_csv(path, parse_dates=list(date_formats) or None, date_format=date_formats or None)
+    if name in MOCK_DATA_INDEX_COLUMNS:
+        # verify_integrity rejects duplicate keys so .at never falls back to the non-unique index path
+        df = df.set_index(MOCK_DATA_INDEX_COLUMNS[name], drop=False, verify_integrity=True)
+    return df
+
+@st.cache_data(show_spinner=False)
+def load_mock_data(file_signature):
+    """Parse the mock CSVs in parallel; file_signature carries the mtimes so edited files are re-read"""
+    with ThreadPoolExecutor(max_workers=len(file_signature)) as executor:
+        frames = executor.map(read_mock_csv, [name for name, _, _ in file_signature], [path for _, path, _ in file_signature])
+        return dict(zip([name for name, _, _ in file_signature], frames))
+
+@st.cache_data(show_spinner=False)
+def index_transactions_by_company(file_signature):
+    """Row positions of each company's extended transactions, grouped once per version of the CSVs"""
+    return load_mock_data(file_signature)['transactions_extended'].groupby('company').indices
 
 # Load static data (fallback)
-static_company_df = pd.read_csv("data/mock_company_summary.csv")
-protocol_df = pd.read_csv("data/mock_protocol_metrics.csv")
-risk_df = pd.read_csv("data/mock_risk_outputs.csv")
-waterfall_df = pd.read_csv("data/mock_waterfall.csv")
-portfolio_tranching_df = pd.read_csv("data/mock_portfolio_tranching.csv")
-transactions_df = pd.read_csv("data/mock_transactions.csv")
-brics_price_df = pd.read_csv("data/mock_brics_price.csv")
-transactions_extended_df = pd.read_csv("data/mock_transactions_extended.csv")
-
-# Initialize company_df as None - will be set by run_all_simulations()
+mock_file_signature = tuple((name, path, os.path.getmtime(path)) for name, path in MOCK_DATA_FILES.items())
+mock_data = load_mock_data(mock_file_signature)
+static_company_df = mock_data['static_company']
+protocol_df = mock_data['protocol']
+risk_df = mock_data['risk']
+waterfall_df = mock_data['waterfall']
+portfolio_tranching_df = mock_data['portfolio_tranching']
+transactions_df = mock_data['transactions']
+brics_price_df = mock_data['brics_price']
+transactions_extended_df = mock_data['transactions_extended']
+transaction_rows_by_company = index_transactions_by_company(mock_file_signature)
+
+# Initialize company_df as None - will be set from session state by run_all_simulations()
 company_df = None
 
 # Initialize session state
@@ -1279,320 +1760,758 @@ if 'live_mode' not in st.session_state:
     st.session_state.live_mode = False
 if 'last_update' not in st.session_state:
     st.session_state.last_update = datetime.now()
+# Simulation tiers are gated on time.monotonic() seconds
 if 'ultra_fast_last_update' not in st.session_state:
-    st.session_state.ultra_fast_last_update = datetime.now()
+    st.session_state.ultra_fast_last_update = time.monotonic()
 if 'fast_last_update' not in st.session_state:
-    st.session_state.fast_last_update = datetime.now()
+    st.session_state.fast_last_update = time.monotonic()
 if 'normal_last_update' not in st.session_state:
-    st.session_state.normal_last_update = datetime.now()
+    st.session_state.normal_last_update = time.monotonic()
 
 # Initialize dynamic company data (will be called after function definition)
 
+# Market stress regimes for the ultra-fast tick: 3/5 normal, 1/5 stress, 1/5 crisis
+STRESS_NORMAL, STRESS_STRESS, STRESS_CRISIS = 0, 1, 2
+STRESS_LEVEL_CHOICES = np.array([STRESS_NORMAL, STRESS_NORMAL, STRESS_NORMAL, STRESS_STRESS, STRESS_CRISIS])
+
+# Order of the metrics returned by the ultra-fast tick kernel
+ULTRA_FAST_METRICS = [
+    'brics_price', 'cds_premiums_monthly', 'zar_rate', 'sovereign_yield_monthly',
+    'monthly_yield_total', 'apy_per_brics', 'weighted_pd', 'capital_efficiency'
+]
+
+def ultra_fast_tick_kernel(cds_monthly, sovereign_monthly, zar_rate, weighted_pd, capital_efficiency, stress_code, draws):
+    """Advance the price, yield, FX, PD and efficiency metrics by one tick"""
+    if stress_code == STRESS_NORMAL:
+        price_volatility = 0.005  # ±$0.005 range
+        currency_volatility = 0.02  # ±2% ZAR movement
+        yield_volatility = 0.1     # ±0.1% yield change
+        stress_multiplier = 1.0
+    elif stress_code == STRESS_STRESS:
+        price_volatility = 0.015   # ±$0.015 range
+        currency_volatility = 0.05  # ±5% ZAR movement
+        yield_volatility = 0.3     # ±0.3% yield change
+        stress_multiplier = 1.5
+    else:  # crisis
+        price_volatility = 0.025   # ±$0.025 range
+        currency_volatility = 0.10  # ±10% ZAR movement
+        yield_volatility = 0.5     # ±0.5% yield change
+        stress_multiplier = 2.0
+    
+    # Target price: $1.00 peg plus monthly yield component and ZAR deviation effect
+    base_price = 1.00
+    yield_component = (cds_monthly + sovereign_monthly) / 100  # Convert % to decimal
+    zar_effect = (zar_rate - 18.5) / 100
+    target_price = base_price + yield_component + zar_effect
+    
+    # Market volatility, ±1% arbitrage pressure and ±0.5% volume effect, scaled by stress
+    price_change = draws[0] * price_volatility
+    arbitrage_pressure = draws[1] * 0.01
+    volume_effect = draws[2] * 0.005
+    total_price_change = (price_change + arbitrage_pressure + volume_effect) * stress_multiplier
+    new_price = max(0.95, min(1.10, target_price + total_price_change))  # Bounds for realism
+    
+    # CDS premiums, USD-ZAR rate and SA Treasury yield
+    new_cds = max(1.0, min(3.0, cds_monthly + draws[3] * 0.1 * yield_volatility))
+    new_zar = max(15.0, min(25.0, zar_rate + draws[4] * currency_volatility))
+    new_sovereign = max(0.5, min(1.5, sovereign_monthly + draws[5] * 0.05 * yield_volatility))
+    
+    # Monthly yield total and APY
+    new_total = new_cds + new_sovereign
+    new_apy = new_total * 12
+    
+    # Weighted PD only drifts up under market stress
+    new_pd = weighted_pd
+    if stress_code != STRESS_NORMAL:
+        if stress_code == STRESS_STRESS:
+            pd_low, pd_high = 0.001, 0.005
+        else:
+            pd_low, pd_high = 0.005, 0.015
+        new_pd = min(0.15, weighted_pd + pd_low + (pd_high - pd_low) * (draws[6] + 1) / 2)
+    
+    # Capital efficiency
+    new_eff = max(5.0, min(12.0, capital_efficiency + draws[7] * 0.05))
+    
+    return new_price, new_cds, new_zar, new_sovereign, new_total, new_apy, new_pd, new_eff
+
+@st.cache_resource
+def get_ultra_fast_tick_kernel():
+    """Compile the ultra-fast tick kernel once per process when numba is installed"""
+    if NUMBA_AVAILABLE:
+        return njit(cache=True)(ultra_fast_tick_kernel)
+    return ultra_fast_tick_kernel
+
 # Tiered real-time data simulation
 def simulate_ultra_fast_data():
     """Ultra-fast updates (5 seconds): $BRICS price with realistic bands around $1.00"""
     if st.session_state.live_mode:
-        current_time = datetime.now()
-        if (current_time - st.session_state.ultra_fast_last_update).seconds >= 5:
+        current_time = time.monotonic()
+        if current_time - st.session_state.ultra_fast_last_update >= 5:
             
             # Determine market stress level (affects volatility)
-            stress_level = random.choice(['normal', 'normal', 'normal', 'stress', 'crisis'])  # 75% normal, 20% stress, 5% crisis
-            
-            if stress_level == 'normal':
-                price_volatility = 0.005  # ±$0.005 range
-                currency_volatility = 0.02  # ±2% ZAR movement
-                yield_volatility = 0.1     # ±0.1% yield change
-            elif stress_level == 'stress':
-                price_volatility = 0.015   # ±$0.015 range
-                currency_volatility = 0.05  # ±5% ZAR movement
-                yield_volatility = 0.3     # ±0.3% yield change
-            else:  # crisis
-                price_volatility = 0.025   # ±$0.025 range
-                currency_volatility = 0.10  # ±10% ZAR movement
-                yield_volatility = 0.5     # ±0.5% yield change
-            
-            # Update $BRICS price with realistic bands around $1.00
-            current_price = protocol_df[protocol_df['metric'] == 'brics_price']['value'].iloc[0]
-            base_price = 1.00  # Target stablecoin price
-            
-            # Calculate yield component
-            cds_monthly = protocol_df[protocol_df['metric'] == 'cds_premiums_monthly']['value'].iloc[0]
-            sovereign_monthly = protocol_df[protocol_df['metric'] == 'sovereign_yield_monthly']['value'].iloc[0]
-            zar_rate = protocol_df[protocol_df['metric'] == 'zar_rate']['value'].iloc[0]
-            
-            # Yield component (monthly to price adjustment)
-            yield_component = (cds_monthly + sovereign_monthly) / 100  # Convert % to decimal
-            zar_effect = (zar_rate - 18.5) / 100  # ZAR deviation effect
-            
-            # Target price with yield component
-            target_price = base_price + yield_component + zar_effect
-            
-            # Add realistic volatility with arbitrage effects
-            # Base market volatility
-            price_change = random.uniform(-price_volatility, price_volatility)
-            
-            # Add arbitrage pressure (investors buying/selling based on yield opportunities)
-            arbitrage_pressure = random.uniform(-0.01, 0.01)  # ±1% arbitrage effect
-            
-            # Add market stress effects (more volatility during stress)
-            stress_multiplier = 1.0
-            if stress_level != 'normal':
-                stress_multiplier = 1.5 if stress_level == 'stress' else 2.0
-            
-            # Add volume-based volatility (higher volume = more volatility)
-            volume_effect = random.uniform(-0.005, 0.005)  # ±0.5% volume effect
-            
-            # Combine all effects
-            total_price_change = (price_change + arbitrage_pressure + volume_effect) * stress_multiplier
-            new_price = max(0.95, min(1.10, target_price + total_price_change))  # Bounds for realism
-            
-            price_mask = protocol_df['metric'] == 'brics_price'
-            protocol_df.loc[price_mask, 'value'] = new_price
-            
-            # Update CDS premiums with realistic changes
-            cds_change = random.uniform(-0.1, 0.1) * yield_volatility
-            new_cds = max(1.0, min(3.0, cds_monthly + cds_change))
-            cds_mask = protocol_df['metric'] == 'cds_premiums_monthly'
-            protocol_df.loc[cds_mask, 'value'] = new_cds
-            
-            # Update USD-ZAR rate with realistic volatility
-            zar_change = random.uniform(-currency_volatility, currency_volatility)
-            new_zar = max(15.0, min(25.0, zar_rate + zar_change))
-            zar_mask = protocol_df['metric'] == 'zar_rate'
-            protocol_df.loc[zar_mask, 'value'] = new_zar
-            
-            # Update SA Treasury yield
-            current_sovereign = protocol_df[protocol_df['metric'] == 'sovereign_yield_monthly']['value'].iloc[0]
-            sovereign_change = random.uniform(-0.05, 0.05) * yield_volatility
-            new_sovereign = max(0.5, min(1.5, current_sovereign + sovereign_change))
-            sovereign_mask = protocol_df['metric'] == 'sovereign_yield_monthly'
-            protocol_df.loc[sovereign_mask, 'value'] = new_sovereign
-            
-            # Update monthly yield total
-            new_total = new_cds + new_sovereign
-            total_mask = protocol_df['metric'] == 'monthly_yield_total'
-            protocol_df.loc[total_mask, 'value'] = new_total
-            
-            # Update APY
-            new_apy = new_total * 12
-            apy_mask = protocol_df['metric'] == 'apy_per_brics'
-            protocol_df.loc[apy_mask, 'value'] = new_apy
-            
-            # Update weighted PD based on market stress
-            if stress_level != 'normal':
-                pd_adjustment = random.uniform(0.001, 0.005) if stress_level == 'stress' else random.uniform(0.005, 0.015)
-                current_pd = protocol_df[protocol_df['metric'] == 'weighted_pd']['value'].iloc[0]
-                new_pd = min(0.15, current_pd + pd_adjustment)
-                pd_mask = protocol_df['metric'] == 'weighted_pd'
-                protocol_df.loc[pd_mask, 'value'] = new_pd
+            stress_code = int(RNG.choice(STRESS_LEVEL_CHOICES))
+            
+            # One batched draw in [-1, 1) covers every random movement in this tick
+            draws = RNG.uniform(-1, 1, size=8)
+            
+            new_values = get_ultra_fast_tick_kernel()(
+                float(protocol_df.at['cds_premiums_monthly', 'value']),
+                float(protocol_df.at['sovereign_yield_monthly', 'value']),
+                float(protocol_df.at['zar_rate', 'value']),
+                float(protocol_df.at['weighted_pd', 'value']),
+                float(protocol_df.at['capital_efficiency', 'value']),
+                stress_code,
+                draws
+            )
             
-            # Update capital efficiency
-            eff_change = random.uniform(-0.05, 0.05)
-            current_eff = protocol_df[protocol_df['metric'] == 'capital_efficiency']['value'].iloc[0]
-            new_eff = max(5.0, min(12.0, current_eff + eff_change))
-            eff_mask = protocol_df['metric'] == 'capital_efficiency'
-            protocol_df.loc[eff_mask, 'value'] = new_eff
+            # Write the tick's metric updates back in one indexed assignment
+            protocol_df.loc[ULTRA_FAST_METRICS, 'value'] = list(new_values)
             
             st.session_state.ultra_fast_last_update = current_time
 
+# Per-tick move bounds for the fast tier: PD, yield (%), spread (bps)
+FAST_TICK_DELTA_SCALES = np.array([[0.003], [0.3], [2.0]])
+
 def simulate_fast_data():
     """Fast updates (45 seconds): Dynamic company-level changes and transactions"""
     if st.session_state.live_mode:
-        current_time = datetime.now()
-        if (current_time - st.session_state.fast_last_update).seconds >= 45:
+        current_time = time.monotonic()
+        if current_time - st.session_state.fast_last_update >= 45:
+            n_companies = len(company_df)
+            
+            # Scalar draws for this tick in [0, 1): transaction chance, amount, CDS change, minting chance, minted tokens
+            tick_draws = RNG.random(5)
             
             # Simulate new transaction for random company (40% chance)
-            if random.random() < 0.4:
-                random_company = random.choice(company_df['company'].tolist())
-                company_idx = company_df[company_df['company'] == random_company].index[0]
+            if tick_draws[0] < 0.4:
+                company_pos = RNG.integers(n_companies)
+                
+                # Positional column slots for scalar .iat updates
+                exposure_col = company_df.columns.get_loc('total_exposure')
+                notional_change_col = company_df.columns.get_loc('notional_24h_change')
+                cds_change_col = company_df.columns.get_loc('cds_fee_24h_change')
                 
                 # Add new transaction amount
-                current_exposure = company_df.loc[company_idx, 'total_exposure']
-                new_transaction = random.uniform(50000, 300000)
-                company_df.loc[company_idx, 'total_exposure'] += new_transaction
+                new_transaction = 50000 + tick_draws[1] * 250000
+                company_df.iat[company_pos, exposure_col] += new_transaction
                 
                 # Update 24h change
-                company_df.loc[company_idx, 'notional_24h_change'] += new_transaction
+                company_df.iat[company_pos, notional_change_col] += new_transaction
                 
-                # Update CDS fee change
-                cds_change = random.uniform(-0.1, 0.1)
-                current_cds_change = company_df.loc[company_idx, 'cds_fee_24h_change']
-                company_df.loc[company_idx, 'cds_fee_24h_change'] = current_cds_change + cds_change
+                # Update CDS fee change; the sum is cast back so the float32 column is never upcast
+                cds_change = -0.1 + tick_draws[2] * 0.2
+                company_df.iat[company_pos, cds_change_col] = np.float32(company_df.iat[company_pos, cds_change_col] + cds_change)
             
             # Update all company risk scores and yields (realistic market movements)
-            for idx in company_df.index:
-                # Risk score changes based on market conditions
-                current_pd = company_df.loc[idx, 'avg_pd']
-                pd_change = random.uniform(-0.003, 0.003)
-                new_pd = max(0.01, min(0.15, current_pd + pd_change))
-                company_df.loc[idx, 'avg_pd'] = new_pd
-                
-                # Yield changes based on risk and market conditions
-                current_yield = company_df.loc[idx, 'yield']
-                yield_change = random.uniform(-0.3, 0.3)
-                new_yield = max(25.0, min(40.0, current_yield + yield_change))
-                company_df.loc[idx, 'yield'] = new_yield
-                
-                # Spread changes (basis points)
-                current_spread = company_df.loc[idx, 'spread_bps']
-                spread_change = random.uniform(-2, 2)
-                new_spread = max(20, min(50, current_spread + spread_change))
-                company_df.loc[idx, 'spread_bps'] = new_spread
+            # One draw in [-1, 1) for every column, scaled per row: PD, yield, spread (bps)
+            deltas = RNG.uniform(-1.0, 1.0, (3, n_companies))
+            deltas *= FAST_TICK_DELTA_SCALES
+            
+            # Risk score changes based on market conditions; float32 to match the column dtype
+            company_df['avg_pd'] = np.clip(company_df['avg_pd'].to_numpy() + deltas[0].astype(np.float32), 0.01, 0.15)
+            
+            # Yield changes based on risk and market conditions
+            company_df['yield'] = np.clip(company_df['yield'].to_numpy() + deltas[1].astype(np.float32), 25.0, 40.0)
+            
+            # Spread changes (basis points), rounded back to whole bps
+            company_df['spread_bps'] = np.clip(np.rint(company_df['spread_bps'].to_numpy() + deltas[2]), 20, 50).astype(np.int32)
             
             # Update total notional
             total_exposure = company_df['total_exposure'].sum()
-            notional_mask = protocol_df['metric'] == 'total_notional'
-            protocol_df.loc[notional_mask, 'value'] = total_exposure
+            protocol_df.at['total_notional', 'value'] = total_exposure
             
             # Update tokens minted (can increase with new transactions)
-            current_tokens = protocol_df[protocol_df['metric'] == 'tokens_minted']['value'].iloc[0]
-            if random.random() < 0.1:  # 10% chance of new token minting
-                new_tokens = random.uniform(1000, 5000)
-                tokens_mask = protocol_df['metric'] == 'tokens_minted'
-                protocol_df.loc[tokens_mask, 'value'] = current_tokens + new_tokens
+            current_tokens = protocol_df.at['tokens_minted', 'value']
+            if tick_draws[3] < 0.1:  # 10% chance of new token minting
+                new_tokens = 1000 + tick_draws[4] * 4000
+                protocol_df.at['tokens_minted', 'value'] = current_tokens + new_tokens
             
             st.session_state.fast_last_update = current_time
 
 def simulate_normal_data():
     """Normal updates (5-15 minutes): Portfolio metrics, capital efficiency"""
     if st.session_state.live_mode:
-        current_time = datetime.now()
-        if (current_time - st.session_state.normal_last_update).seconds >= 600:  # 10 minutes
+        current_time = time.monotonic()
+        if current_time - st.session_state.normal_last_update >= 600:  # 10 minutes
             # Update weighted PD
-            weighted_pd = (company_df['avg_pd'] * company_df['total_exposure']).sum() / company_df['total_exposure'].sum()
-            pd_mask = protocol_df['metric'] == 'weighted_pd'
-            protocol_df.loc[pd_mask, 'value'] = weighted_pd
+            weighted_pd = np.average(company_df['avg_pd'].to_numpy(), weights=company_df['total_exposure'].to_numpy())
+            protocol_df.at['weighted_pd', 'value'] = weighted_pd
+            
+            # Capital efficiency and overcollateralization moves in [-1, 1)
+            deltas = RNG.uniform(-1, 1, 2)
             
             # Update capital efficiency slightly
-            current_eff = protocol_df[protocol_df['metric'] == 'capital_efficiency']['value'].iloc[0]
-            eff_change = random.uniform(-0.1, 0.1)
+            current_eff = protocol_df.at['capital_efficiency', 'value']
+            eff_change = deltas[0] * 0.1
             new_eff = max(5.0, current_eff + eff_change)
-            eff_mask = protocol_df['metric'] == 'capital_efficiency'
-            protocol_df.loc[eff_mask, 'value'] = new_eff
+            protocol_df.at['capital_efficiency', 'value'] = new_eff
             
             # Update overcollateralization
-            current_oc = protocol_df[protocol_df['metric'] == 'overcollateralization']['value'].iloc[0]
-            oc_change = random.uniform(-0.005, 0.005)
+            current_oc = protocol_df.at['overcollateralization', 'value']
+            oc_change = deltas[1] * 0.005
             new_oc = max(0.05, current_oc + oc_change)
-            oc_mask = protocol_df['metric'] == 'overcollateralization'
-            protocol_df.loc[oc_mask, 'value'] = new_oc
+            protocol_df.at['overcollateralization', 'value'] = new_oc
             
             st.session_state.normal_last_update = current_time
 
-# Run all simulation tiers
-def run_all_simulations():
-    # Fetch real public data including CDS spreads
-    real_data = fetch_real_public_data()
-    cds_data = fetch_live_cds_data()
+def draw_company_category(column, size):
+    """Draw uniformly from a company label column's categories as category codes"""
+    dtype = COMPANY_CATEGORY_DTYPES[column]
+    return pd.Categorical.from_codes(RNG.integers(0, len(dtype.categories), size), dtype=dtype)
+
+def load_initial_companies():
+    """Generate the initial 100-company private placement portfolio"""
+    n_companies = len(COMPANY_NUMBERS)
+    
+    # Curated portfolio distribution: Focus on larger, more active obligors
+    # Top tier COMP_1-30 large, COMP_31-60 medium, COMP_61-100 smaller but active
+    exposure = np.concatenate([
+        RNG.integers(5000000, 20000000, 30, endpoint=True),
+        RNG.integers(2000000, 5000000, 30, endpoint=True),
+        RNG.integers(500000, 2000000, n_companies - 60, endpoint=True)
+    ])
+    base_pd = np.concatenate([
+        RNG.uniform(0.02, 0.05, 30),
+        RNG.uniform(0.04, 0.08, 30),
+        RNG.uniform(0.06, 0.12, n_companies - 60)
+    ])
+    
+    # Credit rating based on PD: pick one of three candidate ratings per PD band
+    rating_band = np.digitize(base_pd, PD_BAND_BINS)
+    rating_pick = RNG.integers(0, 3, n_companies)
+    ratings = PD_BAND_RATING_CANDIDATES[rating_band, rating_pick]
+    
+    # Yield based on PD and rating (higher PD = higher yield)
+    yield_rate = 25.0 + (base_pd * 150) + RNG.uniform(-5, 5, n_companies)
+    
+    # Spread based on rating
+    spread = PD_BAND_SPREAD_BPS[rating_band, rating_pick] + RNG.integers(-5, 5, n_companies, endpoint=True)
+    
+    # Columns are built at their final dtypes so pandas does no inference or casting
+    return pd.DataFrame({
+        'company': [f"COMP_{i}" for i in COMPANY_NUMBERS],
+        'industry': draw_company_category('industry', n_companies),
+        'credit_rating': pd.Categorical(ratings, dtype=COMPANY_CATEGORY_DTYPES['credit_rating']),
+        'avg_pd': base_pd.astype(COMPANY_COLUMN_DTYPES['avg_pd']),
+        'yield': yield_rate.astype(COMPANY_COLUMN_DTYPES['yield']),
+        'total_exposure': exposure.astype(COMPANY_COLUMN_DTYPES['total_exposure']),
+        'terms_tenor': RNG.integers(30, 180, n_companies, endpoint=True).astype(COMPANY_COLUMN_DTYPES['terms_tenor']),
+        'spread_bps': spread.astype(COMPANY_COLUMN_DTYPES['spread_bps']),
+        'status': draw_company_category('status', n_companies),
+        'credit_type': draw_company_category('credit_type', n_companies),
+        'underwriting_bank': draw_company_category('underwriting_bank', n_companies),
+        'time_listed': draw_company_category('time_listed', n_companies),
+        'notional_24h_change': np.zeros(n_companies, dtype=COMPANY_COLUMN_DTYPES['notional_24h_change']),
+        'cds_fee_24h_change': np.zeros(n_companies, dtype=COMPANY_COLUMN_DTYPES['cds_fee_24h_change'])
+    })
+
+@st.cache_resource
+def get_initial_companies():
+    """Build the starting portfolio once per process; callers copy it before mutating"""
+    return load_initial_companies()
+
+# Status tiers: sorted upper bounds (exclusive) and the label for each band, lowest first
+PRICE_DEVIATION_TIERS = ([0.01, 0.02], [('status-stable', '🟢 STABLE'), ('status-volatile', '🟡 VOLATILE'), ('status-stress', '🔴 STRESS')])
+PRICE_VOLATILITY_TIERS = ([0.5, 1.0], ['🟢 Low', '🟡 Medium', '🔴 High'])
+PORTFOLIO_PD_TIERS = ([0.08, 0.12], ['🟢 Low Risk', '🟡 Medium', '🔴 High Risk'])
+
+# Target bands: inclusive (low, high) range and the labels for below, inside and above it
+APY_TARGET_BAND = ((25, 35), ['🔴 Low', '🟢 Target', '🟡 High'])
+CAPITAL_EFFICIENCY_BAND = ((8, 10), ['🔴 Low', '🟢 Optimal', '🟡 High'])
+
+def tier_label(value, tiers):
+    """Label of the tier containing value"""
+    bounds, labels = tiers
+    return labels[bisect_right(bounds, value)]
+
+def band_label(value, band):
+    """Label for value being below, inside or above a target band"""
+    (low, high), labels = band
+    return labels[int(value >= low) + int(value > high)]
+
+# Synthetic price history: 90 days of 6-hourly points
+PRICE_HISTORY_DAYS = 90
+PRICE_POINTS_PER_DAY = 4
+
+def build_synthetic_price_series(live, now=None, rng=RNG):
+    """Generate the yield-inclusive $BRICS price history for the chart in one vectorized pass"""
+    now = now if now is not None else pd.Timestamp.now()
+    n_points = PRICE_HISTORY_DAYS * PRICE_POINTS_PER_DAY
+    timestamps = pd.date_range(now - pd.Timedelta(days=PRICE_HISTORY_DAYS), periods=n_points, freq='6h')
+    
+    # Base yield component (~2.5%) plus a small ZAR effect
+    yield_component = 0.025 + rng.normal(0, 0.005, n_points) + rng.normal(0, 0.002, n_points)
+    
+    if live:
+        # Last 30 days are extremely volatile (like portfolio backtesting), older data less so
+        recent = (now - timestamps).days.to_numpy() <= 30
+        yield_component += rng.normal(0, np.where(recent, 0.015, 0.01))  # Daily volatility
+        market_noise = rng.normal(0, np.where(recent, 0.01, 0.005))
+        arbitrage_pressure = np.where(recent, rng.normal(0, 0.02, n_points), 0.0)  # ±2% on recent data only
+        stress_multiplier = np.where(recent & (rng.random(n_points) < 0.1), 2.0, 1.0)  # 10% chance of extreme stress
+        price = (1.00 + yield_component + market_noise + arbitrage_pressure) * stress_multiplier
+        price_cap = 1.30  # Allow $0.90 - $1.30 range
+    else:
+        yield_component += rng.normal(0, 0.012, n_points)  # ±1.2% daily volatility
+        market_noise = rng.normal(0, 0.008, n_points)
+        arbitrage_effect = rng.normal(0, 0.01, n_points)
+        price = 1.00 + yield_component + market_noise + arbitrage_effect
+        price_cap = 1.25
+    
+    return pd.DataFrame({'timestamp': timestamps, 'close': np.clip(price, 0.90, price_cap)})
+
+# Seconds a generated price history is reused across reruns (the live price-update cadence)
+PRICE_SERIES_REFRESH_SECONDS = 5
+
+@st.cache_data(ttl=PRICE_SERIES_REFRESH_SECONDS, show_spinner=False)
+def get_synthetic_price_series(live, refresh_bucket):
+    """Cached price history; refresh_bucket advances every PRICE_SERIES_REFRESH_SECONDS to force a new draw"""
+    # Seeding from the cache key makes each bucket's draw reproducible, so a cache miss rebuilds the same series
+    return build_synthetic_price_series(live, rng=np.random.default_rng([refresh_bucket, int(live)]))
+
+def price_refresh_bucket(now):
+    """Index of the PRICE_SERIES_REFRESH_SECONDS window containing now"""
+    return int(now.timestamp() // PRICE_SERIES_REFRESH_SECONDS)
+
+def yield_inclusive_price(metrics):
+    """Current $BRICS price as the $1.00 peg plus monthly CDS and sovereign yield and a ZAR effect"""
+    current_yield_total = (metrics['cds_premiums_monthly'] + metrics['sovereign_yield_monthly']) / 100  # Convert % to decimal
+    zar_effect = (metrics['zar_rate'] - 18.5) / 100 * 0.1  # ZAR effect
+    return 1.00 + current_yield_total + zar_effect  # $1.00 peg + yield
+
+# Horizontal price bands drawn on the chart: (price, line dash, line colour, label, label above the line)
+LIVE_PRICE_BANDS = [
+    (1.00, "dash", "gray", "$1.00 Peg", True),
+    (1.03, "dot", "green", "+3% Yield Band", True),
+    (0.97, "dot", "orange", "-3% Band", False),
+]
+STATIC_PRICE_BANDS = LIVE_PRICE_BANDS[:1]
+
+def price_band_layout(bands):
+    """Layout shapes and right-aligned labels for full-width price bands, equivalent to one add_hline per band"""
+    shapes = []
+    annotations = []
+    for price, dash, color, label, above in bands:
+        shapes.append(dict(type='line', xref='x domain', x0=0, x1=1, yref='y', y0=price, y1=price,
+                           line=dict(dash=dash, color=color)))
+        annotations.append(dict(text=label, xref='x domain', x=1, yref='y', y=price, showarrow=False,
+                                xanchor='right', yanchor='bottom' if above else 'top'))
+    return {'shapes': shapes, 'annotations': annotations}
+
+def render_price_chart(metrics):
+    """Render the $BRICS price chart; run as a fragment so it can refresh without rerunning the page"""
+    # Fragment reruns reuse the call's arguments, so the clock is read here rather than passed in
+    now = pd.Timestamp.now()
     
-    # Merge CDS data into real_data
-    real_data.update(cds_data)
+    # $BRICS Price Chart
+    st.markdown("""
+    <div class="chart-container">
+        <h3 style="margin: 0 0 1rem 0; color: #1e3c72; font-weight: 600;">
+            📈 $BRICS Price Chart
+        </h3>
+    """, unsafe_allow_html=True)
+
+    # Create dynamic price chart with yield-inclusive pricing
+    if st.session_state.live_mode:
+        # Generate dynamic price data with yield-inclusive pricing
+        # Use last 90 days of data but add real-time volatility
+        # Calculate yield-inclusive price (peg + yield)
+        current_price = yield_inclusive_price(metrics)
+        
+        # Create yield-inclusive price series with realistic volatility
+        dynamic_df = get_synthetic_price_series(True, price_refresh_bucket(now))
+        
+        # Add real-time current price point (the cached history is a copy, so append in place)
+        current_time = now
+        dynamic_df.loc[len(dynamic_df)] = [current_time, current_price]
+        
+        # Timestamps are sorted, so the last-24h boundary is a binary search and both parts are slices
+        split = dynamic_df['timestamp'].searchsorted(current_time - pd.Timedelta(days=1))
+        historical_data = dynamic_df.iloc[:split]
+        recent_data = dynamic_df.iloc[split:]
+        
+        # Create the chart with yield-inclusive data: all traces and bands go in with one validation pass
+        fig_price = go.Figure(
+            data=[
+                # Historical data (less volatile)
+                go.Scatter(
+                    x=historical_data['timestamp'],
+                    y=historical_data['close'],
+                    mode='lines',
+                    name='Historical Price (Yield Inclusive)',
+                    line=dict(color='#1f77b4', width=1.5)
+                ),
+                # Recent data (more volatile)
+                go.Scatter(
+                    x=recent_data['timestamp'],
+                    y=recent_data['close'],
+                    mode='lines',
+                    name='Recent Price (Live)',
+                    line=dict(color='#ff7f0e', width=2.5)
+                ),
+                # Current price point
+                go.Scatter(
+                    x=[current_time],
+                    y=[current_price],
+                    mode='markers',
+                    name='Current Price',
+                    marker=dict(color='red', size=10, symbol='diamond'),
+                    showlegend=True
+                ),
+            ],
+            layout=dict(
+                title="$BRICS Price (Yield Inclusive) - $1.00 Peg + Yield + Volatility",
+                xaxis_title="Time",
+                yaxis_title="Price (USD)",
+                height=400,
+                hovermode='x unified',
+                legend=dict(
+                    yanchor="top",
+                    y=0.99,
+                    xanchor="left",
+                    x=0.01
+                ),
+                # Add yield-inclusive bands
+                **price_band_layout(LIVE_PRICE_BANDS)
+            )
+        )
+        
+    else:
+        # Static mode - use yield-inclusive pricing
+        # Generate synthetic data for static mode with high volatility
+        static_df = get_synthetic_price_series(False, price_refresh_bucket(now))
+        
+        fig_price = go.Figure(
+            data=[go.Scatter(
+                x=static_df['timestamp'],
+                y=static_df['close'],
+                mode='lines',
+                name='$BRICS Price (Yield Inclusive - Static)',
+                line=dict(color='#1f77b4', width=2)
+            )],
+            layout=dict(
+                title="$BRICS Price (Yield Inclusive) - Static Mode",
+                xaxis_title="Time",
+                yaxis_title="Price (USD)",
+                height=400,
+                hovermode='x unified',
+                # Add yield bands for static mode
+                **price_band_layout(STATIC_PRICE_BANDS)
+            )
+        )
+
+    st.plotly_chart(fig_price, use_container_width=True, key="price_chart")
+
+# Columns shown in the Portfolio Analysis "Companies with Recent Activity" table
+ACTIVE_COMPANY_COLUMNS = ['company', 'industry', 'credit_rating', 'notional_24h_change', 'cds_fee_24h_change']
+
+def portfolio_aggregates(company_df):
+    """Portfolio Analysis totals and breakdowns, computed once per rerun and shared by the page and its obligor panel"""
+    exposures = company_df['total_exposure']
+    
+    # One pass over both label columns; the per-label totals are then rolled up from the small result
+    exposure_by_pair = exposures.groupby([company_df['industry'], company_df['credit_rating']], observed=True).sum()
+    active_mask = company_df['notional_24h_change'].to_numpy() != 0
+    return SimpleNamespace(
+        total_exposure=exposures.sum(),
+        avg_pd=company_df['avg_pd'].mean(),
+        avg_yield=company_df['yield'].mean(),
+        num_obligors=len(company_df),
+        num_industries=company_df['industry'].nunique(),
+        min_rating=company_df['credit_rating'].min(),
+        max_rating=company_df['credit_rating'].max(),
+        min_exposure=exposures.min(),
+        max_exposure=exposures.max(),
+        industry_exposure=exposure_by_pair.groupby(level='industry', observed=True).sum(),
+        rating_exposure=exposure_by_pair.groupby(level='credit_rating', observed=True).sum(),
+        active_mask=active_mask,
+        active_table=company_df.loc[active_mask, ACTIVE_COMPANY_COLUMNS]
+    )
+
+def sampled_portfolio(company_df, n=20, seed=0):
+    """Fixed-seed obligor sample for the per-obligor charts, so the same data gives the same sample and figures"""
+    return company_df.sample(min(n, len(company_df)), random_state=seed).reset_index(drop=True)
+
+# ============================================================================
+# CACHED CHART BUILDERS
+# ============================================================================
+# Each builder is keyed on the data it plots, so reruns with unchanged inputs reuse the stored figure.
+# Builders fed per-rerun data keep only a few recent figures (enough for fragment reruns to hit);
+# figures of data that is redrawn on every rerun are not cached at all
+
+# Figures kept per builder whose inputs change with the company data
+CHART_CACHE_MAX_ENTRIES = 8
+
+@st.cache_data(show_spinner=False, max_entries=CHART_CACHE_MAX_ENTRIES)
+def build_yield_breakdown_fig(cds_premiums, sovereign_yield):
+    """Stacked monthly CDS premium and sovereign yield bars for Unit Economics"""
+    fig = go.Figure(data=[
+        go.Bar(name='CDS Premiums (Monthly)', x=['CDS Premiums'], y=[cds_premiums], marker_color='blue'),
+        go.Bar(name='Sovereign Yield (Monthly)', x=['Sovereign Yield'], y=[sovereign_yield], marker_color='green')
+    ])
+    fig.update_layout(title="Monthly Yield Breakdown", barmode='stack', height=300)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def build_waterfall_fig(waterfall_df):
+    """Monthly cash flow waterfall by recipient"""
+    fig = px.bar(waterfall_df, x="recipient", y="amount_usd", 
+                 title="Monthly Cash Flow ($25,000 CDS Premium)",
+                 color="tier", color_continuous_scale="viridis")
+    fig.update_layout(xaxis_title="Recipient", yaxis_title="Amount (USD)")
+    return fig
+
+@st.cache_data(show_spinner=False)
+def build_tranching_fig(portfolio_tranching_df):
+    """Portfolio tranching pie, excluding the Total row"""
+    return px.pie(portfolio_tranching_df[portfolio_tranching_df['tranche'] != 'Total'], 
+                  names="tranche", values="notional_amount", 
+                  title="$BRICS Portfolio Tranching (Total: $8.48M)",
+                  color="risk_level", color_discrete_map={'Low': 'green', 'Medium': 'orange', 'High': 'red'})
+
+@st.cache_data(show_spinner=False, max_entries=CHART_CACHE_MAX_ENTRIES)
+def build_exposure_fig(exposure, title):
+    """Bar chart of a total_exposure Series already summed by a label column"""
+    return px.bar(exposure.reset_index(), x=exposure.index.name, y="total_exposure", title=title)
+
+@st.cache_data(show_spinner=False, max_entries=CHART_CACHE_MAX_ENTRIES)
+def build_obligor_pd_fig(sample_df):
+    """PD by obligor for the sampled obligors, coloured by credit rating"""
+    # Colour by plain labels: older plotly releases fail on categoricals with categories absent from the sample
+    fig = px.bar(sample_df.astype({'credit_rating': str}), x="company", y="avg_pd", 
+                 title="Probability of Default by Obligor (Sample)", 
+                 labels={"avg_pd": "PD (%)"}, color="credit_rating")
+    fig.update_layout(yaxis_tickformat='.1%')
+    fig.update_traces(marker_line_width=0)  # No bar outlines to stroke (bars have no WebGL trace)
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=CHART_CACHE_MAX_ENTRIES)
+def build_obligor_yield_fig(sample_df):
+    """Yield by obligor for the sampled obligors, coloured by industry"""
+    fig = px.bar(sample_df.astype({'industry': str}), x="company", y="yield", 
+                 title="Yield by Obligor (Sample)", 
+                 labels={"yield": "Yield (%)"}, color="industry")
+    fig.update_traces(marker_line_width=0)
+    return fig
+
+def build_stress_fig(stress_df):
+    """Portfolio loss by stress scenario"""
+    return px.bar(stress_df, x='scenario', y='loss_percent',
+                  title="Stress Testing Results - Portfolio Loss by Scenario",
+                  color='loss_percent', color_continuous_scale='Reds')
+
+def build_correlation_fig(correlation_matrix):
+    """Obligor correlation heatmap"""
+    return px.imshow(correlation_matrix,
+                     title="Obligor Correlation Matrix",
+                     color_continuous_scale='RdBu',
+                     aspect='auto')
+
+def metric_row(items):
+    """Lay out (label, value, delta) metrics side by side, one equal-width column each"""
+    for column, (label, value, delta) in zip(st.columns(len(items)), items):
+        column.metric(label, value, delta)
+
+def render_obligor_panel(dynamic_company_df, portfolio):
+    """Render the Portfolio Analysis obligor selector and the overview or obligor details it selects"""
+    # Second Row
+    col3, col4 = st.columns(2)
     
-    # Calculate realistic $BRICS price using real data + CDS spreads
-    realistic_brics_price = calculate_realistic_brics_price(real_data)
+    with col3:
+        st.markdown("""
+        <div class="section-card">
+            <div class="section-header">OBLIGOR ANALYSIS</div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Interactive obligor selection
+        selected_company = st.selectbox(
+            "Select an obligor for detailed analysis:",
+            options=["Portfolio Overview"] + list(dynamic_company_df['company'].unique()),
+            index=0
+        )
+
+    if selected_company == "Portfolio Overview":
+        # Show all obligors (limit to first 20 for display)
+        display_df = dynamic_company_df.head(20)
+        st.dataframe(display_df, use_container_width=True)
+        
+        # Show summary stats for all 100 companies
+        st.markdown("**📊 Portfolio Summary (All 100 Companies):**")
+        metric_row([
+            ("Total Companies", portfolio.num_obligors, None),
+            ("Industries Represented", portfolio.num_industries, None),
+            ("Credit Rating Range", f"{portfolio.min_rating} - {portfolio.max_rating}", None),
+            ("Size Range", f"${portfolio.min_exposure:,.0f} - ${portfolio.max_exposure:,.0f}", None)
+        ])
+        
+        # Transaction Activity Analysis
+        st.markdown("**🔄 Transaction Activity Analysis:**")
+        
+        # Count companies with recent activity
+        active_companies = np.count_nonzero(portfolio.active_mask)
+        inactive_companies = portfolio.num_obligors - active_companies
+        
+        # Show live transaction data if available
+        if 'live_transactions_df' in st.session_state and not st.session_state.live_transactions_df.empty:
+            live_companies = len(st.session_state.live_tx_rows_by_company)
+        else:
+            live_companies = "N/A"
+        
+        metric_row([
+            ("Active Companies (24h)", active_companies, f"{active_companies/portfolio.num_obligors*100:.1f}%"),
+            ("Inactive Companies (24h)", inactive_companies, f"{inactive_companies/portfolio.num_obligors*100:.1f}%"),
+            ("Live Transaction Companies", live_companies, None)
+        ])
+        
+        # Show companies with recent activity
+        if active_companies > 0:
+            st.markdown("**📈 Companies with Recent Activity:**")
+            st.dataframe(portfolio.active_table, use_container_width=True)
+        else:
+            st.info("No companies have had transactions in the current update cycle. This is normal - not all companies are active every minute.")
+        
+        # Transaction Distribution Pattern
+        st.markdown("**📊 Private Placement Transaction Pattern:**")
+        render_static_doc(TRANSACTION_PATTERN_MD)
+        
+        # Portfolio visualizations
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Sample 20 companies for visualization to avoid overcrowding
+            sample_df = sampled_portfolio(dynamic_company_df)
+            fig_pd = build_obligor_pd_fig(sample_df)
+            st.plotly_chart(fig_pd, use_container_width=True, key="pd_by_obligor")
+        
+        with col2:
+            fig_yield = build_obligor_yield_fig(sample_df)
+            st.plotly_chart(fig_yield, use_container_width=True, key="yield_by_obligor")
+        
+        # Additional charts
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            fig_industry = build_exposure_fig(portfolio.industry_exposure, "Exposure by Industry")
+            st.plotly_chart(fig_industry, use_container_width=True, key="exposure_by_industry")
+        
+        with col2:
+            fig_rating = build_exposure_fig(portfolio.rating_exposure, "Exposure by Credit Rating")
+            st.plotly_chart(fig_rating, use_container_width=True, key="exposure_by_rating")
+
+    else:
+        # Show selected company details
+        company_data = dynamic_company_df[dynamic_company_df['company'] == selected_company].iloc[0]
+        
+        # Model outputs and transaction history only exist for the static obligors, not the dynamic ones
+        has_risk_data = selected_company in risk_df.index
+        risk_data = risk_df.loc[selected_company] if has_risk_data else None
+        
+        company_transactions = transactions_extended_df.iloc[transaction_rows_by_company.get(selected_company, [])]
+        has_transaction_data = not company_transactions.empty
+        
+        st.subheader(f"📊 {selected_company} - Obligor Analysis")
+        
+        # Company metrics
+        metric_row([
+            ("Total Exposure", f"${company_data['total_exposure']:,.0f}", None),
+            ("Average PD", f"{company_data['avg_pd']*100:.1f}%", None),
+            ("Yield", f"{company_data['yield']:.1f}%", None),
+            ("Credit Rating", company_data['credit_rating'], None)
+        ])
+        
+        # Company details
+        col1, col2 = st.columns(2)
+        with col1:
+            st.write("**Company Information:**")
+            st.write(f"- Industry: {company_data['industry']}")
+            st.write(f"- Credit Type: {company_data['credit_type']}")
+            st.write(f"- Underwriting Bank: {company_data['underwriting_bank']}")
+            st.write(f"- Terms: {company_data['terms_tenor']} days")
+            st.write(f"- Time Listed: {company_data['time_listed']}")
+            st.write(f"- Spread: {company_data['spread_bps']} bps")
+            st.write(f"- Status: {company_data['status']}")
+        
+        with col2:
+            st.write("**Risk Metrics:**")
+            if has_risk_data:
+                st.write(f"- XGBoost PD: {risk_data['xgboost_pd']*100:.1f}%")
+                st.write(f"- Lévy Copula Tail Risk: {risk_data['levy_copula_tail_risk']*100:.1f}%")
+                st.write(f"- CDS Spread: {risk_data['cds_spread']} bps")
+            else:
+                st.write(f"- Calculated PD: {company_data['avg_pd']*100:.1f}%")
+                st.write(f"- Yield Spread: {company_data['spread_bps']} bps")
+                st.write(f"- Risk Level: {company_data['credit_rating']}")
+            st.write(f"- 24h Notional Change: ${company_data['notional_24h_change']:,.0f}")
+            st.write(f"- 24h CDS Fee Change: {company_data['cds_fee_24h_change']:.1f}%")
+        
+        # Transaction history with timeline
+        st.subheader("Transaction History")
+        if has_transaction_data and not company_transactions.empty:
+            fig_transactions = px.line(company_transactions, x="date", y="amount", 
+                                     title=f"{selected_company} - Transaction Amounts Over Time",
+                                     labels={"amount": "Amount (USD)", "date": "Date"},
+                                     render_mode='webgl')  # Scattergl trace, drawn on the GPU
+            fig_transactions.update_layout(xaxis_title="Date", yaxis_title="Amount (USD)")
+            st.plotly_chart(fig_transactions, use_container_width=True, key="company_transactions")
+            
+            # Transaction summary
+            amounts = company_transactions['amount'].to_numpy()
+            metric_row([
+                ("Total Transactions", len(amounts), None),
+                ("Average Transaction", f"${amounts.mean():,.0f}", None),
+                ("Total Volume", f"${amounts.sum():,.0f}", None)
+            ])
+            
+            st.dataframe(company_transactions, use_container_width=True)
+        else:
+            st.info("📊 **Live Transaction Data:** This company participates in the real-time transaction stream. Recent transactions are displayed on the Dashboard page under 'Live Transaction Stream'.")
+            
+            # Show live transaction data if available
+            if 'live_transactions_df' in st.session_state and not st.session_state.live_transactions_df.empty:
+                live_tx_df = st.session_state.live_transactions_df
+                company_live_tx = live_tx_df.iloc[st.session_state.live_tx_rows_by_company.get(selected_company, [])]
+                if not company_live_tx.empty:
+                    st.markdown("**🔄 Recent Live Transactions:**")
+                    st.dataframe(company_live_tx[['transaction_id', 'type', 'amount', 'pd', 'credit_rating', 'industry']], use_container_width=True)
+                else:
+                    st.info("No recent live transactions for this company in the current update cycle.")
+
+# Run all simulation tiers
+def run_all_simulations():
+    # Fetch real public data including CDS spreads only when the session's copy is stale
+    current_time = time.monotonic()
+    if ('real_data' not in st.session_state
+            or current_time - st.session_state.real_data_fetched_at >= REAL_DATA_REFRESH_SECONDS):
+        real_data = fetch_real_public_data()
+        cds_data = fetch_live_cds_data()
+        
+        # Merge CDS data into real_data
+        real_data.update(cds_data)
+        
+        # Calculate realistic $BRICS price using real data + CDS spreads
+        st.session_state.realistic_brics_price = calculate_realistic_brics_price(real_data)
+        st.session_state.real_data = real_data
+        st.session_state.cds_data = cds_data
+        st.session_state.real_data_fetched_at = current_time
+        st.session_state.last_real_data_update = datetime.now()
     
     # Update protocol metrics with real data
     global protocol_df
-    protocol_df.loc[protocol_df['metric'] == 'brics_price', 'value'] = realistic_brics_price
+    protocol_df.at['brics_price', 'value'] = st.session_state.realistic_brics_price
     
     # Simulate live transaction data
-    live_transactions = simulate_live_transaction_data()
+    live_transactions_df = simulate_live_transaction_data()
     
-    # Initialize company data if not exists or is None
+    # Each batch is applied to a fresh copy of the cached starting portfolio: the update writes absolute
+    # per-batch values and 24h changes, so carrying the previous rerun's frame forward would drift
     global company_df
-    if company_df is None:
-        
-        # Create 100 diverse companies
-        companies = []
-        industries = [
-            'mining', 'manufacturing', 'financial', 'retail', 'agriculture',
-            'energy', 'technology', 'telecommunications', 'beverages', 'automotive',
-            'construction', 'healthcare', 'education', 'logistics', 'real_estate'
-        ]
-        
-        credit_ratings = ['AAA', 'AA+', 'AA', 'AA-', 'A+', 'A', 'A-', 'BBB+', 'BBB', 'BBB-', 'BB+', 'BB', 'BB-']
-        credit_types = ['Trade Receivables', 'Supply Chain Finance', 'Working Capital', 'Equipment Finance', 'Invoice Discounting']
-        banks = ['First National Bank', 'Standard Bank', 'Nedbank', 'ABSA Bank', 'Old Mutual', 'Investec', 'Capitec', 'African Bank']
-        
-        for i in range(1, 101):
-            # Curated portfolio distribution: Focus on larger, more active obligors
-            # In private placement, we select obligors for their activity and credit quality
-            if i <= 30:
-                # Top tier: Large, active companies (30% of portfolio)
-                size_category = 'large'
-            elif i <= 60:
-                # Second tier: Medium companies (30% of portfolio)
-                size_category = 'medium'
-            elif i <= 85:
-                # Third tier: Smaller but active companies (25% of portfolio)
-                size_category = 'small'
-            else:
-                # Fourth tier: Specialized companies (15% of portfolio)
-                size_category = 'small'  # Even specialized companies are active
-            
-            if size_category == 'large':
-                exposure = random.randint(5000000, 20000000)
-                base_pd = random.uniform(0.02, 0.05)
-            elif size_category == 'medium':
-                exposure = random.randint(2000000, 5000000)
-                base_pd = random.uniform(0.04, 0.08)
-            elif size_category == 'small':
-                exposure = random.randint(500000, 2000000)
-                base_pd = random.uniform(0.06, 0.12)
-            else:  # very_small
-                exposure = random.randint(100000, 500000)
-                base_pd = random.uniform(0.10, 0.20)
-            
-            # Credit rating based on PD
-            if base_pd < 0.03:
-                rating = random.choice(['AAA', 'AA+', 'AA'])
-            elif base_pd < 0.05:
-                rating = random.choice(['AA-', 'A+', 'A'])
-            elif base_pd < 0.08:
-                rating = random.choice(['A-', 'BBB+', 'BBB'])
-            elif base_pd < 0.12:
-                rating = random.choice(['BBB-', 'BB+', 'BB'])
-            else:
-                rating = random.choice(['BB-', 'B+', 'B'])
-            
-            # Yield based on PD and rating
-            base_yield = 25.0 + (base_pd * 150)  # Higher PD = higher yield
-            yield_adjustment = random.uniform(-5, 5)
-            yield_rate = base_yield + yield_adjustment
-            
-            # Spread based on rating
-            spread_base = {'AAA': 15, 'AA+': 18, 'AA': 20, 'AA-': 22, 'A+': 25, 'A': 28, 'A-': 30,
-                          'BBB+': 35, 'BBB': 38, 'BBB-': 42, 'BB+': 50, 'BB': 60, 'BB-': 75}
-            spread = spread_base.get(rating, 40) + random.randint(-5, 5)
-            
-            company = {
-                'company': f"COMP_{i}",
-                'industry': random.choice(industries),
-                'credit_rating': rating,
-                'avg_pd': base_pd,
-                'yield': yield_rate,
-                'total_exposure': exposure,
-                'terms_tenor': random.randint(30, 180),
-                'spread_bps': spread,
-                'status': random.choice(['On track', 'Watch', 'Under review', 'Stable']),
-                'credit_type': random.choice(credit_types),
-                'underwriting_bank': random.choice(banks),
-                'time_listed': random.choice(['1mo ago', '2mo ago', '3mo ago', '6mo ago', '1yr ago']),
-                'notional_24h_change': 0,
-                'cds_fee_24h_change': 0.0
-            }
-            companies.append(company)
-        
-        company_df = pd.DataFrame(companies)
-    
-    # Update company metrics from live transaction data
-    company_df = update_company_metrics_from_transactions(company_df, live_transactions)
-    
-    # Store live transaction data in session state
-    st.session_state.live_transactions = live_transactions
-    st.session_state.real_data = real_data
-    st.session_state.cds_data = cds_data
-    st.session_state.last_real_data_update = datetime.now()
+    company_df = update_company_metrics_from_transactions(get_initial_companies().copy(), live_transactions_df)
+    
+    # Store live transaction data in session state, with each company's row positions indexed once at ingestion
+    st.session_state.live_transactions_df = live_transactions_df
+    st.session_state.live_tx_rows_by_company = live_transactions_df.groupby('company_id').indices
+    st.session_state.risk_factors_df = build_risk_factor_frame(company_df)
 
 # Initialize dynamic company data after function definition
 run_all_simulations()
@@ -1605,17 +2524,7 @@ run_all_simulations()
 # SIDEBAR NAVIGATION
 # ============================================================================
 with st.sidebar:
-    sidebar_html = f"""
-    <div style="padding: 1rem 0; text-align: center;">
-        <div style="margin-bottom: 1rem;">
-            {BRICS_LOGO_HTML}
-        </div>
-        <h3 style="margin: 0; color: {BRICS_COLORS['primary']}; font-weight: 600; font-family: {BRICS_FONTS['heading']};">{BRICS_BRAND['name']}</h3>
-        <p style="margin: 0.5rem 0; font-size: 0.9rem; color: {BRICS_COLORS['neutral']}; font-family: {BRICS_FONTS['body']};">{BRICS_BRAND['tagline']}</p>
-    </div>
-    """
-    
-    html(sidebar_html, height=120)
+    html(build_sidebar_html(), height=120)
     
     # Navigation menu
     page = st.selectbox(
@@ -1639,7 +2548,7 @@ with st.sidebar:
     
     # Essential protocol status only
     st.markdown("**Protocol Status:**")
-    st.metric("$BRICS Price", f"${protocol_df[protocol_df['metric'] == 'brics_price']['value'].iloc[0]:.3f}")
+    st.metric("$BRICS Price", f"${protocol_df.at['brics_price', 'value']:.3f}")
     st.metric("Sovereign Rating", "BBB- (Stable)")
 
 # ============================================================================
@@ -1651,28 +2560,21 @@ if page == "Dashboard":
     # ============================================================================
     create_branded_header()
     
+    # Protocol metrics as a {metric: value} dict, read once for the whole page
+    metrics = get_protocol_metrics()
+    
+    # One clock read per rerun for the status row; the price chart fragment reads its own clock
+    now = pd.Timestamp.now()
+    
     # PROMINENT CURRENT PRICE - FIRST THING USERS SEE
-    current_price = protocol_df[protocol_df['metric'] == 'brics_price']['value'].iloc[0]
+    current_price = metrics['brics_price']
     price_change = current_price - 1.00
     price_change_pct = (price_change / 1.00) * 100
     
     # Determine live mode status
     live_status = "🟢 LIVE" if st.session_state.live_mode else "⚪ STATIC"
     
-    st.markdown(f"""
-    <div style="background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%); 
-                color: white; padding: 2rem; border-radius: 1rem; margin: 1rem 0; 
-                text-align: center; box-shadow: 0 8px 32px rgba(0,0,0,0.1);">
-        <h2 style="margin: 0; font-size: 1.2rem; opacity: 0.9;">Sovereign-Backed $BRICS</h2>
-        <h1 style="margin: 0.5rem 0; font-size: 3.5rem; font-weight: 700;">${current_price:.3f}</h1>
-        <p style="margin: 0; font-size: 1.1rem; opacity: 0.9;">
-            Super Senior Tranche • CDS Premium Yield • {live_status}
-        </p>
-        <p style="margin: 0.5rem 0; font-size: 0.9rem; opacity: 0.8;">
-            South African Treasury Backed • FAIS FSP #52815 • Basel III SRT Compliant
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(PRICE_HERO_TEMPLATE.format(price=current_price, status=live_status), unsafe_allow_html=True)
 
     # Protocol Structure Overview
     st.markdown("### 📊 Protocol Structure & Metrics")
@@ -1685,11 +2587,11 @@ if page == "Dashboard":
     
     with col2:
         st.metric("Reserve Account", "$2.5M Backed", "Sovereign guarantee")
-        st.metric("CDS Premium Yield", f"{protocol_df[protocol_df['metric'] == 'apy_per_brics']['value'].iloc[0]:.1f}%", "Synthetic credit yield")
+        st.metric("CDS Premium Yield", f"{metrics['apy_per_brics']:.1f}%", "Synthetic credit yield")
     
     with col3:
         st.metric("Receivables Pool", f"${company_df['total_exposure'].sum():,.0f}", "30-180 day tenor")
-        st.metric("AI-Modeled PD", f"{protocol_df[protocol_df['metric'] == 'weighted_pd']['value'].iloc[0]*100:.1f}%", "Credit default probability")
+        st.metric("AI-Modeled PD", f"{metrics['weighted_pd']*100:.1f}%", "Credit default probability")
     
     with col4:
         st.metric("Regulatory Status", "FAIS FSP #52815", "South African compliance")
@@ -1751,154 +2653,112 @@ if page == "Dashboard":
             st.metric("5Y CDS Term", f"{cds_5y}bp")
     
     # Live Transaction Stream Section
-    if hasattr(st.session_state, 'live_transactions') and st.session_state.live_transactions:
+    if 'live_transactions_df' in st.session_state and not st.session_state.live_transactions_df.empty:
         st.markdown("### 💳 Live Transaction Stream")
         
-        transactions = st.session_state.live_transactions
+        transactions = st.session_state.live_transactions_df
         
         # Display recent transactions
-        if transactions:
-            # Create transaction summary
-            tx_summary = []
-            for tx in transactions[:5]:  # Show last 5 transactions
-                tx_summary.append({
-                    'ID': tx['transaction_id'][-8:],  # Short ID
-                    'Type': tx['type'].replace('_', ' ').title(),
-                    'Amount': f"${tx['amount']:,.0f}",
-                    'PD': f"{tx['pd']*100:.1f}%",
-                    'Rating': tx['credit_rating'],
-                    'Company': tx['company_id']
-                })
-            
-            tx_df = pd.DataFrame(tx_summary)
-            st.dataframe(tx_df, use_container_width=True, hide_index=True)
+        if not transactions.empty:
+            # Create transaction summary; numeric columns stay numeric and are formatted once by the styler
+            recent_tx = transactions.head(5)  # Show last 5 transactions
+            tx_df = pd.DataFrame({
+                'ID': recent_tx['transaction_id'].str[-8:],  # Short ID
+                'Type': recent_tx['type'].str.replace('_', ' ').str.title(),
+                'Amount': recent_tx['amount'].to_numpy(),
+                'PD': recent_tx['pd'].to_numpy(),
+                'Rating': recent_tx['credit_rating'].to_numpy(),
+                'Company': recent_tx['company_id'].to_numpy()
+            })
+            st.dataframe(tx_df.style.format(TX_SUMMARY_FORMATS), use_container_width=True, hide_index=True)
             
-            # Transaction metrics
+            # Transaction metrics; the active company set is hashed once and shared with the risk table
+            active_companies = transactions['company_id'].unique()
             col1, col2, col3, col4 = st.columns(4)
             with col1:
-                avg_pd = sum(tx['pd'] for tx in transactions) / len(transactions)
+                avg_pd = transactions['pd'].mean()
                 st.metric("Avg Transaction PD", f"{avg_pd*100:.1f}%")
             
             with col2:
-                total_volume = sum(tx['amount'] for tx in transactions)
+                total_volume = transactions['amount'].sum()
                 st.metric("Total Volume", f"${total_volume:,.0f}")
             
             with col3:
-                num_companies = len(set(tx['company_id'] for tx in transactions))
-                st.metric("Active Companies", num_companies)
+                st.metric("Active Companies", len(active_companies))
             
             with col4:
                 # Calculate transaction diversity
-                unique_industries = len(set(tx['industry'] for tx in transactions))
+                unique_industries = transactions['industry'].nunique()
                 st.metric("Industries Represented", unique_industries)
             
             # Company Risk Analysis
             st.markdown("**Company Risk Analysis:**")
             
-            # Calculate risk factors for each company
-            company_risk_analysis = []
-            for company_id in set(tx['company_id'] for tx in transactions):
-                if company_id in company_df['company'].values:
-                    risk_factors = calculate_company_specific_risk(company_id, company_df, transactions)
-                    total_risk = (
-                        risk_factors['industry_risk'] *
-                        risk_factors['size_risk'] *
-                        risk_factors['geographic_risk'] *
-                        risk_factors['business_model_risk'] *
-                        risk_factors['financial_health_risk'] *
-                        risk_factors['management_risk'] *
-                        risk_factors['concentration_risk']
-                    )
-                    
-                    company_risk_analysis.append({
-                        'Company': company_id,
-                        'Industry Risk': f"{risk_factors['industry_risk']:.2f}x",
-                        'Size Risk': f"{risk_factors['size_risk']:.2f}x",
-                        'Geographic Risk': f"{risk_factors['geographic_risk']:.2f}x",
-                        'Business Model Risk': f"{risk_factors['business_model_risk']:.2f}x",
-                        'Financial Health Risk': f"{risk_factors['financial_health_risk']:.2f}x",
-                        'Management Risk': f"{risk_factors['management_risk']:.2f}x",
-                        'Concentration Risk': f"{risk_factors['concentration_risk']:.2f}x",
-                        'Total Risk Multiplier': f"{total_risk:.2f}x"
-                    })
-            
-            if company_risk_analysis:
-                risk_df = pd.DataFrame(company_risk_analysis)
-                st.dataframe(risk_df, use_container_width=True, hide_index=True)
+            # Risk factors for every active company, read from the per-rerun portfolio frame in one pass
+            risk_df = build_company_risk_table(active_companies, st.session_state.risk_factors_df)
+            if not risk_df.empty:
+                st.dataframe(risk_df, use_container_width=True, hide_index=True, column_config=RISK_TABLE_COLUMN_CONFIG)
     
     st.divider()
     
-    # Status and controls row
-    col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
-
-    with col1:
-        st.markdown(f"""
+    # Status and controls row: built as one flex row (2:1:1:1) and sent in a single markdown call
+    last_updated_html = f"""
+    <div style="background: rgba(255,255,255,0.1); padding: 1rem; border-radius: 0.5rem; border: 1px solid rgba(255,255,255,0.2);">
+        <p style="margin: 0; color: white; font-size: 0.9rem;">
+            📅 Last Updated: {now.strftime('%B %d, %Y at %H:%M:%S')}
+        </p>
+    </div>
+    """
+    
+    if st.session_state.live_mode:
+        # Dynamic status based on the current price read for the price hero
+        price_deviation = abs(current_price - 1.00)
+        status_class, status_text = tier_label(price_deviation, PRICE_DEVIATION_TIERS)
+        
+        status_html = f"""
+        <div class="{status_class}" style="text-align: center;">
+            {status_text}
+        </div>
+        """
+        mode_html = """
         <div style="background: rgba(255,255,255,0.1); padding: 1rem; border-radius: 0.5rem; border: 1px solid rgba(255,255,255,0.2);">
-            <p style="margin: 0; color: white; font-size: 0.9rem;">
-                📅 Last Updated: {datetime.now().strftime('%B %d, %Y at %H:%M:%S')}
-            </p>
+            <p style="margin: 0; color: white; font-size: 0.9rem; font-weight: bold;">Update Frequencies:</p>
+            <p style="margin: 0.2rem 0; color: white; font-size: 0.8rem;">• Price: 5s</p>
+            <p style="margin: 0.2rem 0; color: white; font-size: 0.8rem;">• Transactions: 45s</p>
+            <p style="margin: 0.2rem 0; color: white; font-size: 0.8rem;">• Portfolio: 10min</p>
         </div>
-        """, unsafe_allow_html=True)
-
-    with col2:
-        if st.session_state.live_mode:
-            # Dynamic status based on current price
-            current_price = protocol_df[protocol_df['metric'] == 'brics_price']['value'].iloc[0]
-            price_deviation = abs(current_price - 1.00)
-            
-            if price_deviation < 0.01:
-                status_class = "status-stable"
-                status_text = "🟢 STABLE"
-            elif price_deviation < 0.02:
-                status_class = "status-volatile"
-                status_text = "🟡 VOLATILE"
-            else:
-                status_class = "status-stress"
-                status_text = "🔴 STRESS"
-            
-            st.markdown(f"""
-            <div class="{status_class}" style="text-align: center;">
-                {status_text}
-            </div>
-            """, unsafe_allow_html=True)
-        else:
-            st.markdown("""
-            <div style="background: rgba(255,255,255,0.2); color: white; padding: 0.5rem 1rem; border-radius: 2rem; text-align: center; font-weight: bold;">
-                ⏸️ STATIC DATA
-            </div>
-            """, unsafe_allow_html=True)
-
-    with col3:
-        if st.session_state.live_mode:
-            st.markdown("""
-            <div style="background: rgba(255,255,255,0.1); padding: 1rem; border-radius: 0.5rem; border: 1px solid rgba(255,255,255,0.2);">
-                <p style="margin: 0; color: white; font-size: 0.9rem; font-weight: bold;">Update Frequencies:</p>
-                <p style="margin: 0.2rem 0; color: white; font-size: 0.8rem;">• Price: 5s</p>
-                <p style="margin: 0.2rem 0; color: white; font-size: 0.8rem;">• Transactions: 45s</p>
-                <p style="margin: 0.2rem 0; color: white; font-size: 0.8rem;">• Portfolio: 10min</p>
-            </div>
-            """, unsafe_allow_html=True)
-        else:
-            st.markdown("""
-            <div style="background: rgba(255,255,255,0.1); padding: 1rem; border-radius: 0.5rem; border: 1px solid rgba(255,255,255,0.2);">
-                <p style="margin: 0; color: white; font-size: 0.9rem; font-weight: bold;">Static Mode</p>
-                <p style="margin: 0.2rem 0; color: white; font-size: 0.8rem;">Click 'Toggle Live Mode'</p>
-            </div>
-            """, unsafe_allow_html=True)
-
-    with col4:
-        if st.session_state.live_mode:
-            st.markdown("""
-            <div class="live-indicator" style="text-align: center;">
-                🔴 LIVE
-            </div>
-            """, unsafe_allow_html=True)
-        else:
-            st.markdown("""
-            <div style="background: rgba(255,255,255,0.2); color: white; padding: 0.5rem 1rem; border-radius: 2rem; text-align: center; font-weight: bold;">
-                ⚪ OFFLINE
-            </div>
-            """, unsafe_allow_html=True)
+        """
+        indicator_html = """
+        <div class="live-indicator" style="text-align: center;">
+            🔴 LIVE
+        </div>
+        """
+    else:
+        status_html = """
+        <div style="background: rgba(255,255,255,0.2); color: white; padding: 0.5rem 1rem; border-radius: 2rem; text-align: center; font-weight: bold;">
+            ⏸️ STATIC DATA
+        </div>
+        """
+        mode_html = """
+        <div style="background: rgba(255,255,255,0.1); padding: 1rem; border-radius: 0.5rem; border: 1px solid rgba(255,255,255,0.2);">
+            <p style="margin: 0; color: white; font-size: 0.9rem; font-weight: bold;">Static Mode</p>
+            <p style="margin: 0.2rem 0; color: white; font-size: 0.8rem;">Click 'Toggle Live Mode'</p>
+        </div>
+        """
+        indicator_html = """
+        <div style="background: rgba(255,255,255,0.2); color: white; padding: 0.5rem 1rem; border-radius: 2rem; text-align: center; font-weight: bold;">
+            ⚪ OFFLINE
+        </div>
+        """
+    
+    st.markdown(compact_html(f"""
+    <div style="display: flex; gap: 1rem; align-items: flex-start; flex-wrap: wrap;">
+        <div style="flex: 2; min-width: 240px;">{last_updated_html}</div>
+        <div style="flex: 1; min-width: 120px;">{status_html}</div>
+        <div style="flex: 1; min-width: 120px;">{mode_html}</div>
+        <div style="flex: 1; min-width: 120px;">{indicator_html}</div>
+    </div>
+    """), unsafe_allow_html=True)
 
     # Live mode toggle with real-time notifications
     col1, col2 = st.columns([1, 3])
@@ -1911,15 +2771,17 @@ if page == "Dashboard":
     with col2:
         if st.session_state.live_mode:
             # Show real-time update notifications
-            current_time = datetime.now()
-            last_ultra = (current_time - st.session_state.ultra_fast_last_update).seconds
-            last_fast = (current_time - st.session_state.fast_last_update).seconds
-            last_normal = (current_time - st.session_state.normal_last_update).seconds
-            
-            st.markdown("**🟢 Real-time Updates Active:**")
-            st.markdown(f"• Price updates: {last_ultra}s ago")
-            st.markdown(f"• Transaction updates: {last_fast}s ago")
-            st.markdown(f"• Portfolio updates: {last_normal}s ago")
+            current_time = time.monotonic()
+            last_ultra = int(current_time - st.session_state.ultra_fast_last_update)
+            last_fast = int(current_time - st.session_state.fast_last_update)
+            last_normal = int(current_time - st.session_state.normal_last_update)
+            
+            st.markdown(
+                "**🟢 Real-time Updates Active:**\n\n"
+                f"• Price updates: {last_ultra}s ago\n\n"
+                f"• Transaction updates: {last_fast}s ago\n\n"
+                f"• Portfolio updates: {last_normal}s ago"
+            )
         else:
             st.markdown("**⚪ Static Mode - No real-time updates**")
 
@@ -1927,28 +2789,12 @@ if page == "Dashboard":
     
     # Export functionality
     create_export_buttons()
-    
-    # Real-time alerts
-    display_alerts()
-    
-    # Contact CTA Section
-    st.markdown(f"""
-    <div style="background: linear-gradient(135deg, {BRICS_COLORS['primary']} 0%, {BRICS_COLORS['secondary']} 100%); 
-                color: {BRICS_COLORS['white']}; padding: 2rem; border-radius: 1rem; margin: 2rem 0; 
-                text-align: center; box-shadow: 0 8px 32px rgba(0,0,0,0.1);">
-        <h3 style="margin: 0 0 1rem 0; font-family: {BRICS_FONTS['heading']}; font-size: 1.5rem;">
-            Ready to Invest in $BRICS?
-        </h3>
-        <p style="margin: 0 0 1.5rem 0; opacity: 0.9; font-family: {BRICS_FONTS['body']};">
-            Get in touch with our investor relations team for detailed due diligence materials and investment opportunities.
-        </p>
-        <div style="display: flex; justify-content: center; gap: 1rem; flex-wrap: wrap;">
-            <a href="mailto:{BRICS_BRAND['contact']['email']}" class="brics-cta">📧 Contact Founders</a>
-            <a href="{BRICS_BRAND['contact']['website']}" class="brics-cta" target="_blank">�� Visit Website</a>
-            <a href="{BRICS_BRAND['contact']['linkedin']}" class="brics-cta" target="_blank">💼 LinkedIn</a>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    
+    # Real-time alerts
+    display_alerts()
+    
+    # Contact CTA Section
+    st.markdown(build_invest_cta_html(), unsafe_allow_html=True)
 
     # ============================================================================
     # KEY METRICS SECTION
@@ -1964,218 +2810,10 @@ if page == "Dashboard":
     </div>
     """, unsafe_allow_html=True)
 
-    # $BRICS Price Chart
-    st.markdown("""
-    <div class="chart-container">
-        <h3 style="margin: 0 0 1rem 0; color: #1e3c72; font-weight: 600;">
-            📈 $BRICS Price Chart
-        </h3>
-    """, unsafe_allow_html=True)
-
-    # Create dynamic price chart with yield-inclusive pricing
+    # In live mode the price chart refreshes itself every price-update window without a full rerun
     if st.session_state.live_mode:
-        # Generate dynamic price data with yield-inclusive pricing
-        # Use last 90 days of data but add real-time volatility
-        base_df = brics_price_df.copy()
-        base_df['timestamp'] = pd.to_datetime(base_df['timestamp'])
-        
-        # Get current yield components
-        cds_monthly = protocol_df[protocol_df['metric'] == 'cds_premiums_monthly']['value'].iloc[0]
-        sovereign_monthly = protocol_df[protocol_df['metric'] == 'sovereign_yield_monthly']['value'].iloc[0]
-        zar_rate = protocol_df[protocol_df['metric'] == 'zar_rate']['value'].iloc[0]
-        
-        # Calculate yield-inclusive price (peg + yield)
-        current_yield_total = (cds_monthly + sovereign_monthly) / 100  # Convert % to decimal
-        zar_effect = (zar_rate - 18.5) / 100 * 0.1  # ZAR effect
-        current_price = 1.00 + current_yield_total + zar_effect  # $1.00 peg + yield
-        
-        # Create yield-inclusive price series with realistic volatility
-        yield_inclusive_prices = []
-        timestamps = []
-        base_peg = 1.00  # $1.00 peg
-        
-        # Generate completely synthetic data with high volatility (like portfolio backtesting)
-        start_date = pd.Timestamp.now() - pd.Timedelta(days=90)
-        
-        # Generate daily data points for 90 days
-        for day in range(90):
-            current_date = start_date + pd.Timedelta(days=day)
-            
-            # Add multiple price points per day for more variation
-            for hour_offset in range(0, 24, 6):  # Every 6 hours
-                timestamp = current_date + pd.Timedelta(hours=hour_offset)
-                days_ago = (pd.Timestamp.now() - timestamp).days
-                
-                # Base yield component (simulate realistic yield)
-                base_yield = 0.025 + np.random.normal(0, 0.005)  # ~2.5% base yield
-                zar_effect = np.random.normal(0, 0.002)  # Small ZAR effect
-                
-                if days_ago <= 30:  # Recent data - extremely volatile (like portfolio backtesting)
-                    # Add massive volatility like the portfolio chart
-                    daily_volatility = np.random.normal(0, 0.015)  # ±1.5% daily volatility
-                    market_noise = np.random.normal(0, 0.01)  # ±1% market noise
-                    arbitrage_pressure = np.random.normal(0, 0.02)  # ±2% arbitrage effect
-                    
-                    # Add extreme stress events (like portfolio crashes)
-                    stress_multiplier = 1.0
-                    if np.random.random() < 0.1:  # 10% chance of extreme stress
-                        stress_multiplier = 2.0  # Double the volatility
-                    
-                    # Calculate yield-inclusive price with extreme volatility
-                    yield_component = base_yield + zar_effect + daily_volatility
-                    price = base_peg + yield_component + market_noise + arbitrage_pressure
-                    price *= stress_multiplier
-                    
-                else:  # Historical data - still volatile but less extreme
-                    daily_volatility = np.random.normal(0, 0.01)  # ±1% historical volatility
-                    market_noise = np.random.normal(0, 0.005)  # ±0.5% market noise
-                    
-                    yield_component = base_yield + zar_effect + daily_volatility
-                    price = base_peg + yield_component + market_noise
-                
-                # Ensure price stays within realistic bounds but allow more variation
-                price = max(0.90, min(1.30, price))  # Allow $0.90 - $1.30 range
-                yield_inclusive_prices.append(price)
-                timestamps.append(timestamp)
-        
-        # Create new dataframe with yield-inclusive prices and timestamps
-        dynamic_df = pd.DataFrame({
-            'timestamp': timestamps,
-            'close': yield_inclusive_prices
-        })
-        
-        # Add real-time current price point
-        current_time = pd.Timestamp.now()
-        current_row = pd.DataFrame({
-            'timestamp': [current_time],
-            'close': [current_price],
-            'open': [current_price],
-            'high': [current_price * 1.001],
-            'low': [current_price * 0.999],
-            'volume': [np.random.randint(800000, 1500000)]
-        })
-        
-        # Combine historical and current data
-        dynamic_df = pd.concat([dynamic_df, current_row], ignore_index=True)
-        
-        # Create the chart with yield-inclusive data
-        fig_price = go.Figure()
-        
-        # Historical data (less volatile)
-        historical_data = dynamic_df[dynamic_df['timestamp'] < current_time - pd.Timedelta(days=1)]
-        fig_price.add_trace(go.Scatter(
-            x=historical_data['timestamp'],
-            y=historical_data['close'],
-            mode='lines',
-            name='Historical Price (Yield Inclusive)',
-            line=dict(color='#1f77b4', width=1.5)
-        ))
-        
-        # Recent data (more volatile)
-        recent_data = dynamic_df[dynamic_df['timestamp'] >= current_time - pd.Timedelta(days=1)]
-        fig_price.add_trace(go.Scatter(
-            x=recent_data['timestamp'],
-            y=recent_data['close'],
-            mode='lines',
-            name='Recent Price (Live)',
-            line=dict(color='#ff7f0e', width=2.5)
-        ))
-        
-        # Current price point
-        fig_price.add_trace(go.Scatter(
-            x=[current_time],
-            y=[current_price],
-            mode='markers',
-            name='Current Price',
-            marker=dict(color='red', size=10, symbol='diamond'),
-            showlegend=True
-        ))
-        
-        fig_price.update_layout(
-            title="$BRICS Price (Yield Inclusive) - $1.00 Peg + Yield + Volatility",
-            xaxis_title="Time",
-            yaxis_title="Price (USD)",
-            height=400,
-            hovermode='x unified',
-            legend=dict(
-                yanchor="top",
-                y=0.99,
-                xanchor="left",
-                x=0.01
-            )
-        )
-        
-        # Add yield-inclusive bands
-        fig_price.add_hline(y=1.00, line_dash="dash", line_color="gray", 
-                           annotation_text="$1.00 Peg", annotation_position="top right")
-        fig_price.add_hline(y=1.03, line_dash="dot", line_color="green", 
-                           annotation_text="+3% Yield Band", annotation_position="top right")
-        fig_price.add_hline(y=0.97, line_dash="dot", line_color="orange", 
-                           annotation_text="-3% Band", annotation_position="bottom right")
-        
-    else:
-        # Static mode - use yield-inclusive pricing
-        brics_price_df['timestamp'] = pd.to_datetime(brics_price_df['timestamp'])
-        
-        # Calculate yield-inclusive prices for static mode with high volatility
-        static_yield_prices = []
-        static_timestamps = []
-        
-        # Generate synthetic data for static mode with high volatility
-        start_date = pd.Timestamp.now() - pd.Timedelta(days=90)
-        
-        for day in range(90):
-            current_date = start_date + pd.Timedelta(days=day)
-            
-            # Add multiple price points per day
-            for hour_offset in range(0, 24, 6):  # Every 6 hours
-                timestamp = current_date + pd.Timedelta(hours=hour_offset)
-                
-                # Base yield component
-                base_yield = 0.025 + np.random.normal(0, 0.005)  # ~2.5% base yield
-                zar_effect = np.random.normal(0, 0.002)  # Small ZAR effect
-                
-                # Add high volatility (like portfolio backtesting)
-                daily_volatility = np.random.normal(0, 0.012)  # ±1.2% daily volatility
-                market_noise = np.random.normal(0, 0.008)  # ±0.8% market noise
-                arbitrage_effect = np.random.normal(0, 0.01)  # ±1% arbitrage effect
-                
-                # Calculate yield-inclusive price
-                yield_component = base_yield + zar_effect + daily_volatility
-                price = 1.00 + yield_component + market_noise + arbitrage_effect
-                price = max(0.90, min(1.25, price))  # Allow more variation
-                
-                static_yield_prices.append(price)
-                static_timestamps.append(timestamp)
-        
-        # Create new dataframe for static mode
-        static_df = pd.DataFrame({
-            'timestamp': static_timestamps,
-            'close': static_yield_prices
-        })
-        
-        fig_price = go.Figure()
-        fig_price.add_trace(go.Scatter(
-            x=static_df['timestamp'],
-            y=static_df['close'],
-            mode='lines',
-            name='$BRICS Price (Yield Inclusive - Static)',
-            line=dict(color='#1f77b4', width=2)
-        ))
-        
-        fig_price.update_layout(
-            title="$BRICS Price (Yield Inclusive) - Static Mode",
-            xaxis_title="Time",
-            yaxis_title="Price (USD)",
-            height=400,
-            hovermode='x unified'
-        )
-        
-        # Add yield bands for static mode
-        fig_price.add_hline(y=1.00, line_dash="dash", line_color="gray", 
-                           annotation_text="$1.00 Peg", annotation_position="top right")
-
-    st.plotly_chart(fig_price, use_container_width=True, key="price_chart")
+        current_price = yield_inclusive_price(metrics)
+    st.fragment(render_price_chart, run_every=PRICE_SERIES_REFRESH_SECONDS if st.session_state.live_mode else None)(metrics)
 
     # Price drivers explanation
     if st.session_state.live_mode:
@@ -2204,13 +2842,10 @@ if page == "Dashboard":
 
     # Price volatility and range info (simplified)
     if st.session_state.live_mode:
-        # Calculate volatility for live mode
-        recent_prices = [current_price]
-        for _ in range(10):
-            volatility = random.uniform(-0.015, 0.015)
-            recent_prices.append(current_price + volatility)
-        price_volatility = np.std(recent_prices) * 100
-        volatility_status = "🟢 Low" if price_volatility < 0.5 else "🟡 Medium" if price_volatility < 1.0 else "🔴 High"
+        # Calculate volatility for live mode: current price plus 10 simulated moves of up to ±1.5%;
+        # std ignores the common price level, so only the moves (and the current point's 0) are needed
+        price_volatility = np.std(np.append(0.0, RNG.uniform(-0.015, 0.015, 10))) * 100
+        volatility_status = tier_label(price_volatility, PRICE_VOLATILITY_TIERS)
     else:
         price_volatility = 0.3
         volatility_status = "⚪ Static"
@@ -2230,34 +2865,34 @@ if page == "Dashboard":
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        cds_monthly = protocol_df[protocol_df['metric'] == 'cds_premiums_monthly']['value'].iloc[0]
+        cds_monthly = metrics['cds_premiums_monthly']
         st.metric("CDS Premium (Monthly)", f"{cds_monthly:.2f}%")
 
     with col2:
-        sovereign_monthly = protocol_df[protocol_df['metric'] == 'sovereign_yield_monthly']['value'].iloc[0]
+        sovereign_monthly = metrics['sovereign_yield_monthly']
         st.metric("Sovereign Yield (Monthly)", f"{sovereign_monthly:.2f}%")
 
     with col3:
-        total_monthly = protocol_df[protocol_df['metric'] == 'monthly_yield_total']['value'].iloc[0]
-        apy = protocol_df[protocol_df['metric'] == 'apy_per_brics']['value'].iloc[0]
+        total_monthly = metrics['monthly_yield_total']
+        apy = metrics['apy_per_brics']
         st.metric("Total Monthly Yield", f"{total_monthly:.2f}%")
         st.caption(f"Annualized: {apy:.1f}% APY")
 
     # Key protocol metrics (simplified - no repetition)
     st.subheader("Protocol Overview")
-    apy = protocol_df[protocol_df['metric'] == 'apy_per_brics']['value'].iloc[0]
-    capital_eff = protocol_df[protocol_df['metric'] == 'capital_efficiency']['value'].iloc[0]
-    weighted_pd = protocol_df[protocol_df['metric'] == 'weighted_pd']['value'].iloc[0]
+    apy = metrics['apy_per_brics']
+    capital_eff = metrics['capital_efficiency']
+    weighted_pd = metrics['weighted_pd']
 
     col1, col2, col3 = st.columns(3)
     with col1:
-        apy_status = "🟢 Target" if 25 <= apy <= 35 else "🟡 High" if apy > 35 else "🔴 Low"
+        apy_status = band_label(apy, APY_TARGET_BAND)
         st.metric("Target APY", f"{apy:.1f}%", delta=apy_status)
     with col2:
-        eff_status = "🟢 Optimal" if 8 <= capital_eff <= 10 else "🟡 High" if capital_eff > 10 else "🔴 Low"
+        eff_status = band_label(capital_eff, CAPITAL_EFFICIENCY_BAND)
         st.metric("Capital Efficiency", f"{capital_eff:.1f}x", delta=eff_status)
     with col3:
-        pd_status = "🟢 Low Risk" if weighted_pd < 0.08 else "🟡 Medium" if weighted_pd < 0.12 else "🔴 High Risk"
+        pd_status = tier_label(weighted_pd, PORTFOLIO_PD_TIERS)
         st.metric("Portfolio PD", f"{weighted_pd*100:.1f}%", delta=pd_status)
 
     st.divider()
@@ -2265,65 +2900,13 @@ if page == "Dashboard":
     # ============================================================================
     # INVESTMENT SUMMARY SECTION
     # ============================================================================
-    st.markdown("""
-    <div class="section-header">
-        <h2 style="margin: 0; font-size: 1.8rem; font-weight: 600;">
-            💰 Investment Summary
-        </h2>
-        <p style="margin: 0.5rem 0 0 0; opacity: 0.9; font-size: 1rem;">
-            Key investment highlights and risk protection mechanisms
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        st.markdown("""
-        <div class="info-box" style="border-left-color: #28a745;">
-            <h4 style="margin: 0 0 1rem 0; color: #28a745; font-weight: 600;">📈 Yield Sources</h4>
-            <ul style="margin: 0; padding-left: 1.5rem;">
-                <li><strong>CDS Premiums:</strong> 2.14% monthly</li>
-                <li><strong>Sovereign Yield:</strong> 0.73% monthly</li>
-                <li><strong>Total:</strong> 2.87% monthly (34.4% APY)</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col2:
-        st.markdown("""
-        <div class="info-box" style="border-left-color: #ffc107;">
-            <h4 style="margin: 0 0 1rem 0; color: #ffc107; font-weight: 600;">🛡️ Risk Protection</h4>
-            <ul style="margin: 0; padding-left: 1.5rem;">
-                <li><strong>Overcollateralization:</strong> 11.5%</li>
-                <li><strong>Sovereign Guarantee:</strong> First-loss protection</li>
-                <li><strong>Institutional Buffer:</strong> Underwriting protection</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col3:
-        st.markdown("""
-        <div class="info-box" style="border-left-color: #17a2b8;">
-            <h4 style="margin: 0 0 1rem 0; color: #17a2b8; font-weight: 600;">✨ Investment Highlights</h4>
-            <ul style="margin: 0; padding-left: 1.5rem;">
-                <li><strong>No leverage</strong> or borrowing</li>
-                <li><strong>Monthly redemptions</strong> available</li>
-                <li><strong>$10,000 minimum</strong> investment</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
+    # Header and the three info boxes are static, so they go out as one cached markdown payload
+    st.markdown(build_investment_summary_html(), unsafe_allow_html=True)
 
     st.divider()
 
 elif page == "Unit Economics":
-    st.markdown("""
-    <div class="section-header">
-        <h1 style="margin: 0; font-size: 2.2rem; font-weight: 700; color: #1e3c72;">
-            💰 UNIT ECONOMICS
-        </h1>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(SECTION_HEADER_UE_HTML, unsafe_allow_html=True)
     
     # Grid Layout (2x2)
     col1, col2 = st.columns(2)
@@ -2335,15 +2918,7 @@ elif page == "Unit Economics":
         </div>
         """, unsafe_allow_html=True)
         
-        st.markdown("""
-        ### How $BRICS Works
-
-        1. **Banks pool trade receivables** from investment-grade corporates (30-180 day tenor)
-        2. **CDS contracts transfer credit risk** to the protocol for regulatory capital relief
-        3. **$BRICS tokenizes the super-senior tranche** (76% of notional)
-        4. **Investors receive monthly CDS premiums** + sovereign yield
-        5. **Redemption via token burn** distributes yield pro rata
-        """)
+        render_static_doc(BRICS_MECHANICS_MD)
     
     with col2:
         st.markdown("""
@@ -2352,15 +2927,7 @@ elif page == "Unit Economics":
         </div>
         """, unsafe_allow_html=True)
         
-        st.markdown("""
-        **For every $1,000 invested in $BRICS:**
-        
-        - **Notional Exposure**: $8,700 (8.7x leverage)
-        - **Monthly Yield**: $28.70 (2.87% monthly)
-        - **Annual Yield**: $344.40 (34.4% APY)
-        - **Risk Buffer**: $115 (11.5% overcollateralization)
-        - **Sovereign Protection**: $82 (first-loss guarantee)
-        """)
+        render_static_doc(INVESTMENT_EXAMPLE_MD)
     
     # Second Row
     col3, col4 = st.columns(2)
@@ -2373,14 +2940,11 @@ elif page == "Unit Economics":
         """, unsafe_allow_html=True)
         
         # Yield breakdown chart
-        cds_premiums = protocol_df[protocol_df['metric'] == 'cds_premiums_monthly']['value'].iloc[0]
-        sovereign_yield = protocol_df[protocol_df['metric'] == 'sovereign_yield_monthly']['value'].iloc[0]
+        metrics = get_protocol_metrics()
+        cds_premiums = metrics['cds_premiums_monthly']
+        sovereign_yield = metrics['sovereign_yield_monthly']
         
-        fig_yield_breakdown = go.Figure(data=[
-            go.Bar(name='CDS Premiums (Monthly)', x=['CDS Premiums'], y=[cds_premiums], marker_color='blue'),
-            go.Bar(name='Sovereign Yield (Monthly)', x=['Sovereign Yield'], y=[sovereign_yield], marker_color='green')
-        ])
-        fig_yield_breakdown.update_layout(title="Monthly Yield Breakdown", barmode='stack', height=300)
+        fig_yield_breakdown = build_yield_breakdown_fig(cds_premiums, sovereign_yield)
         st.plotly_chart(fig_yield_breakdown, use_container_width=True, key="yield_breakdown")
     
     with col4:
@@ -2391,19 +2955,11 @@ elif page == "Unit Economics":
         """, unsafe_allow_html=True)
         
         # Cash Flow Waterfall
-        fig_waterfall = px.bar(waterfall_df, x="recipient", y="amount_usd", 
-                               title="Monthly Cash Flow ($25,000 CDS Premium)",
-                               color="tier", color_continuous_scale="viridis")
-        fig_waterfall.update_layout(xaxis_title="Recipient", yaxis_title="Amount (USD)")
+        fig_waterfall = build_waterfall_fig(waterfall_df)
         st.plotly_chart(fig_waterfall, use_container_width=True, key="cash_flow_waterfall")
         
         # APY calculation explanation
-        st.markdown("""
-        **APY Calculation:**
-        - Monthly Yield: 2.87% (CDS 2.14% + Sovereign 0.73%)
-        - Annualized: 2.87% × 12 = **34.4% APY**
-        - Portfolio Average: 33.2% (weighted by obligor exposure)
-        """)
+        render_static_doc(APY_CALCULATION_MD)
 
 elif page == "Portfolio Analysis":
     st.markdown("""
@@ -2421,6 +2977,7 @@ elif page == "Portfolio Analysis":
     else:
         # Fallback to static data
         dynamic_company_df = static_company_df
+    portfolio = portfolio_aggregates(dynamic_company_df)
     
     # Grid Layout (2x2)
     col1, col2 = st.columns(2)
@@ -2433,17 +2990,13 @@ elif page == "Portfolio Analysis":
         """, unsafe_allow_html=True)
         
         # Portfolio Overview
-        total_exposure = dynamic_company_df['total_exposure'].sum()
-        avg_pd = dynamic_company_df['avg_pd'].mean()
-        avg_yield = dynamic_company_df['yield'].mean()
-
         col1_1, col1_2 = st.columns(2)
         with col1_1:
-            st.metric("Total Notional", f"${total_exposure:,.0f}")
-            st.metric("Average PD", f"{avg_pd*100:.1f}%")
+            st.metric("Total Notional", f"${portfolio.total_exposure:,.0f}")
+            st.metric("Average PD", f"{portfolio.avg_pd*100:.1f}%")
         with col1_2:
-            st.metric("Average Yield", f"{avg_yield:.1f}%")
-            st.metric("Number of Obligors", len(dynamic_company_df))
+            st.metric("Average Yield", f"{portfolio.avg_yield:.1f}%")
+            st.metric("Number of Obligors", portfolio.num_obligors)
     
     with col2:
         st.markdown("""
@@ -2453,230 +3006,20 @@ elif page == "Portfolio Analysis":
         """, unsafe_allow_html=True)
         
         # Portfolio Tranching
-        fig_tranching = px.pie(portfolio_tranching_df[portfolio_tranching_df['tranche'] != 'Total'], 
-                               names="tranche", values="notional_amount", 
-                               title="$BRICS Portfolio Tranching (Total: $8.48M)",
-                               color="risk_level", color_discrete_map={'Low': 'green', 'Medium': 'orange', 'High': 'red'})
+        fig_tranching = build_tranching_fig(portfolio_tranching_df)
         st.plotly_chart(fig_tranching, use_container_width=True, key="portfolio_tranching")
 
-    # Second Row
-    col3, col4 = st.columns(2)
-    
-    with col3:
-        st.markdown("""
-        <div class="section-card">
-            <div class="section-header">OBLIGOR ANALYSIS</div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Interactive obligor selection
-        selected_company = st.selectbox(
-            "Select an obligor for detailed analysis:",
-            options=["Portfolio Overview"] + list(dynamic_company_df['company'].unique()),
-            index=0
-        )
-
-    if selected_company == "Portfolio Overview":
-        # Show all obligors (limit to first 20 for display)
-        display_df = dynamic_company_df.head(20)
-        st.dataframe(display_df, use_container_width=True)
-        
-        # Show summary stats for all 100 companies
-        st.markdown("**📊 Portfolio Summary (All 100 Companies):**")
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("Total Companies", len(dynamic_company_df))
-        with col2:
-            st.metric("Industries Represented", len(dynamic_company_df['industry'].unique()))
-        with col3:
-            st.metric("Credit Rating Range", f"{dynamic_company_df['credit_rating'].min()} - {dynamic_company_df['credit_rating'].max()}")
-        with col4:
-            st.metric("Size Range", f"${dynamic_company_df['total_exposure'].min():,.0f} - ${dynamic_company_df['total_exposure'].max():,.0f}")
-        
-        # Transaction Activity Analysis
-        st.markdown("**🔄 Transaction Activity Analysis:**")
-        
-        # Count companies with recent activity
-        active_companies = len(dynamic_company_df[dynamic_company_df['notional_24h_change'] != 0])
-        inactive_companies = len(dynamic_company_df[dynamic_company_df['notional_24h_change'] == 0])
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Active Companies (24h)", active_companies, f"{active_companies/len(dynamic_company_df)*100:.1f}%")
-        with col2:
-            st.metric("Inactive Companies (24h)", inactive_companies, f"{inactive_companies/len(dynamic_company_df)*100:.1f}%")
-        with col3:
-            # Show live transaction data if available
-            if hasattr(st.session_state, 'live_transactions') and st.session_state.live_transactions:
-                live_companies = len(set(tx['company_id'] for tx in st.session_state.live_transactions))
-                st.metric("Live Transaction Companies", live_companies)
-            else:
-                st.metric("Live Transaction Companies", "N/A")
-        
-        # Show companies with recent activity
-        if active_companies > 0:
-            st.markdown("**📈 Companies with Recent Activity:**")
-            active_df = dynamic_company_df[dynamic_company_df['notional_24h_change'] != 0][['company', 'industry', 'credit_rating', 'notional_24h_change', 'cds_fee_24h_change']]
-            st.dataframe(active_df, use_container_width=True)
-        else:
-            st.info("No companies have had transactions in the current update cycle. This is normal - not all companies are active every minute.")
-        
-        # Transaction Distribution Pattern
-        st.markdown("**📊 Private Placement Transaction Pattern:**")
-        st.markdown("""
-        **Curated Portfolio System:**
-        - **Per Update (3 seconds)**: 2-5 transactions (curated selection)
-        - **Per Minute**: ~20-30 companies get transactions
-        - **Per Hour**: ~80-90 companies get transactions  
-        - **Per Day**: ~95-100 companies get transactions
-        
-        **Why This Reflects Private Placement:**
-        - **Selective Obligor Choice**: We choose active, creditworthy companies
-        - **Weighted Selection**: Larger companies (COMP_1-30) are 3x more likely to be selected
-        - **Quality Focus**: Medium companies (COMP_31-60) are 2x more likely
-        - **Activity-Based**: All selected obligors should show regular transaction activity
-        """)
-        
-        # Portfolio visualizations
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Sample 20 companies for visualization to avoid overcrowding
-            sample_df = dynamic_company_df.sample(min(20, len(dynamic_company_df)))
-            fig_pd = px.bar(sample_df, x="company", y="avg_pd", 
-                            title="Probability of Default by Obligor (Sample)", 
-                            labels={"avg_pd": "PD (%)"}, color="credit_rating")
-            fig_pd.update_layout(yaxis_tickformat='.1%')
-            st.plotly_chart(fig_pd, use_container_width=True, key="pd_by_obligor")
-        
-        with col2:
-            fig_yield = px.bar(sample_df, x="company", y="yield", 
-                               title="Yield by Obligor (Sample)", 
-                               labels={"yield": "Yield (%)"}, color="industry")
-            st.plotly_chart(fig_yield, use_container_width=True, key="yield_by_obligor")
-        
-        # Additional charts
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig_industry = px.bar(dynamic_company_df.groupby('industry')['total_exposure'].sum().reset_index(), 
-                                  x="industry", y="total_exposure", title="Exposure by Industry")
-            st.plotly_chart(fig_industry, use_container_width=True, key="exposure_by_industry")
-        
-        with col2:
-            fig_rating = px.bar(dynamic_company_df.groupby('credit_rating')['total_exposure'].sum().reset_index(),
-                                x="credit_rating", y="total_exposure", title="Exposure by Credit Rating")
-            st.plotly_chart(fig_rating, use_container_width=True, key="exposure_by_rating")
-
-    else:
-        # Show selected company details
-        company_data = dynamic_company_df[dynamic_company_df['company'] == selected_company].iloc[0]
-        
-        # Try to get risk data, but handle case where it doesn't exist for dynamic companies
-        try:
-            risk_data = risk_df[risk_df['company'] == selected_company].iloc[0]
-            has_risk_data = True
-        except:
-            has_risk_data = False
-            risk_data = None
-        
-        # Try to get transaction data, but handle case where it doesn't exist for dynamic companies
-        try:
-            company_transactions = transactions_extended_df[transactions_extended_df['company'] == selected_company]
-            has_transaction_data = not company_transactions.empty
-        except:
-            has_transaction_data = False
-            company_transactions = pd.DataFrame()
-        
-        st.subheader(f"📊 {selected_company} - Obligor Analysis")
-        
-        # Company metrics
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("Total Exposure", f"${company_data['total_exposure']:,.0f}")
-        with col2:
-            st.metric("Average PD", f"{company_data['avg_pd']*100:.1f}%")
-        with col3:
-            st.metric("Yield", f"{company_data['yield']:.1f}%")
-        with col4:
-            st.metric("Credit Rating", company_data['credit_rating'])
-        
-        # Company details
-        col1, col2 = st.columns(2)
-        with col1:
-            st.write("**Company Information:**")
-            st.write(f"- Industry: {company_data['industry']}")
-            st.write(f"- Credit Type: {company_data['credit_type']}")
-            st.write(f"- Underwriting Bank: {company_data['underwriting_bank']}")
-            st.write(f"- Terms: {company_data['terms_tenor']} days")
-            st.write(f"- Time Listed: {company_data['time_listed']}")
-            st.write(f"- Spread: {company_data['spread_bps']} bps")
-            st.write(f"- Status: {company_data['status']}")
-        
-        with col2:
-            st.write("**Risk Metrics:**")
-            if has_risk_data:
-                st.write(f"- XGBoost PD: {risk_data['xgboost_pd']*100:.1f}%")
-                st.write(f"- Lévy Copula Tail Risk: {risk_data['levy_copula_tail_risk']*100:.1f}%")
-                st.write(f"- CDS Spread: {risk_data['cds_spread']} bps")
-            else:
-                st.write(f"- Calculated PD: {company_data['avg_pd']*100:.1f}%")
-                st.write(f"- Yield Spread: {company_data['spread_bps']} bps")
-                st.write(f"- Risk Level: {company_data['credit_rating']}")
-            st.write(f"- 24h Notional Change: ${company_data['notional_24h_change']:,.0f}")
-            st.write(f"- 24h CDS Fee Change: {company_data['cds_fee_24h_change']:.1f}%")
-        
-        # Transaction history with timeline
-        st.subheader("Transaction History")
-        if has_transaction_data and not company_transactions.empty:
-            # Convert date to datetime for proper plotting
-            company_transactions['date'] = pd.to_datetime(company_transactions['date'])
-            
-            fig_transactions = px.line(company_transactions, x="date", y="amount", 
-                                     title=f"{selected_company} - Transaction Amounts Over Time",
-                                     labels={"amount": "Amount (USD)", "date": "Date"})
-            fig_transactions.update_layout(xaxis_title="Date", yaxis_title="Amount (USD)")
-            st.plotly_chart(fig_transactions, use_container_width=True, key="company_transactions")
-            
-            # Transaction summary
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Total Transactions", len(company_transactions))
-            with col2:
-                st.metric("Average Transaction", f"${company_transactions['amount'].mean():,.0f}")
-            with col3:
-                st.metric("Total Volume", f"${company_transactions['amount'].sum():,.0f}")
-            
-            st.dataframe(company_transactions, use_container_width=True)
-        else:
-            st.info("📊 **Live Transaction Data:** This company participates in the real-time transaction stream. Recent transactions are displayed on the Dashboard page under 'Live Transaction Stream'.")
-            
-            # Show live transaction data if available
-            if hasattr(st.session_state, 'live_transactions') and st.session_state.live_transactions:
-                company_live_tx = [tx for tx in st.session_state.live_transactions if tx['company_id'] == selected_company]
-                if company_live_tx:
-                    st.markdown("**🔄 Recent Live Transactions:**")
-                    live_tx_df = pd.DataFrame(company_live_tx)
-                    st.dataframe(live_tx_df[['transaction_id', 'type', 'amount', 'pd', 'credit_rating', 'industry']], use_container_width=True)
-                else:
-                    st.info("No recent live transactions for this company in the current update cycle.")
+    # Obligor analysis runs as a fragment: changing the selected obligor reruns only this panel
+    st.fragment(render_obligor_panel)(dynamic_company_df, portfolio)
 
 elif page == "Technical Details":
     st.header("Technical Implementation")
     
-    st.markdown("""
-    ### AI/ML Risk Models
-    
-    **XGBoost Credit Scoring**: Analyzes 2M+ datapoints to calculate probability of default for each obligor.
-    
-    **Lévy Copula Tail Risk**: Models joint default risk and extreme tail events across the portfolio.
-    
-    **Real-Time Pricing**: CDS premiums calculated dynamically based on risk signals and market conditions.
-    """)
+    render_static_doc(RISK_MODELS_MD)
     
     # Risk model outputs
     st.subheader("Risk Model Outputs")
-    st.dataframe(risk_df, use_container_width=True)
+    st.dataframe(risk_df, use_container_width=True, hide_index=True)
     
     # Tenor distribution
     st.subheader("Exposure by Tenor")
@@ -2732,9 +3075,9 @@ elif page == "Technical Details":
         
         # Data quality metrics
         if connection_status:
-            avg_freshness = sum(s['data_freshness'] for s in connection_status.values()) / len(connection_status)
-            avg_success = sum(s['success_rate'] for s in connection_status.values()) / len(connection_status)
-            avg_error = sum(s['error_rate'] for s in connection_status.values()) / len(connection_status)
+            # Stage the three quality fields once and average them in a single reduction
+            quality = np.array([(s['data_freshness'], s['success_rate'], s['error_rate']) for s in connection_status.values()], dtype=np.float64)
+            avg_freshness, avg_success, avg_error = quality.mean(axis=0)
             
             st.subheader("Data Quality Metrics")
             st.metric("Avg Data Freshness", f"{avg_freshness:.1f}s")
@@ -2853,9 +3196,7 @@ elif page == "Advanced Analytics":
         
         stress_df = pd.DataFrame(stress_data)
         
-        fig_stress = px.bar(stress_df, x='scenario', y='loss_percent',
-                          title="Stress Testing Results - Portfolio Loss by Scenario",
-                          color='loss_percent', color_continuous_scale='Reds')
+        fig_stress = build_stress_fig(stress_df)
         st.plotly_chart(fig_stress, use_container_width=True, key="stress_testing")
         
         # Concentration Risk
@@ -2879,10 +3220,7 @@ elif page == "Advanced Analytics":
         st.subheader("Obligor Correlation Matrix")
         correlation_matrix = risk_analytics.calculate_correlations(company_df)
         
-        fig_corr = px.imshow(correlation_matrix,
-                           title="Obligor Correlation Matrix",
-                           color_continuous_scale='RdBu',
-                           aspect='auto')
+        fig_corr = build_correlation_fig(correlation_matrix)
         st.plotly_chart(fig_corr, use_container_width=True, key="correlation_matrix")
     
     with col4:
@@ -3062,6 +3400,9 @@ elif page == "API Integration":
             st.metric("Error Rate", "0.1%", delta="🟢 Low")
 
 elif page == "AI/ML Analytics":
+    # scikit-learn backed models are imported on first visit to this page only
+    from ml_predictions import ml_predictor, model_updater
+    
     st.markdown("""
     <div class="section-header">
         <h1 style="margin: 0; font-size: 2.2rem; font-weight: 700; color: #1e3c72;">
@@ -3124,7 +3465,6 @@ elif page == "AI/ML Analytics":
         # Create forecast chart data
         if forecast_data and 'forecasts' in forecast_data:
             forecast_df = pd.DataFrame(forecast_data['forecasts'])
-            forecast_df['date'] = pd.to_datetime(forecast_df['date'])
             forecast_df['predicted_yield'] = forecast_df['predicted_yield'] * 100  # Convert to percentage
             
             # Forecast chart
@@ -3162,7 +3502,6 @@ elif page == "AI/ML Analytics":
         # Backtest chart
         if backtest_data and 'historical_data' in backtest_data:
             backtest_df = backtest_data['historical_data']
-            backtest_df['date'] = pd.to_datetime(backtest_df['date'])
             
             fig_backtest = px.line(backtest_df, x='date', y='portfolio_value',
                                   title="Portfolio Value Over Time (Backtest)",